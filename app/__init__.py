@@ -1,28 +1,48 @@
+import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from flask_migrate import Migrate
+from flask_migrate import Migrate, upgrade
 import os
+import threading
 from urllib.parse import urlparse, parse_qs
 
 db = SQLAlchemy()
 migrate = Migrate()
 
-def create_app(environ=None, start_response=None):
-    app = Flask(__name__, static_folder='docs', static_url_path='/docs')
-    
-    # Load and modify DATABASE_URL to ensure SSL
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+def database_url():
+    # Load and modify DATABASE_URL to ensure SSL for Postgres
     db_url = os.getenv("DATABASE_URL")
-    if db_url:
+    if db_url and urlparse(db_url).scheme.startswith("postgres"):
         parsed_url = urlparse(db_url)
         if not parse_qs(parsed_url.query).get('sslmode'):
-            db_url += "?sslmode=require"
-    app.config["SQLALCHEMY_DATABASE_URI"] = db_url or "sqlite:///default.db"
+            db_url += ("&" if parsed_url.query else "?") + "sslmode=require"
+    return db_url or "sqlite:///default.db"
+
+def engine_options(db_url):
+    # Pool settings apply per app instance, i.e. once per gunicorn worker
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    }
+    if not db_url.startswith("sqlite"):
+        options["pool_size"] = int(os.getenv("DB_POOL_SIZE", "5"))
+        options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    return options
+
+def create_app():
+    app = Flask(__name__, static_folder='docs', static_url_path='/docs')
+
+    db_url = database_url()
+    app.config["SQLALCHEMY_DATABASE_URI"] = db_url
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(db_url)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    
+
     # Initialize database and migrate
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db, directory=MIGRATIONS_DIR)
 
     # Enable CORS for all routes, allowing requests from GitHub Pages with specific methods and headers
     CORS(app, resources={r"/api/*": {
@@ -37,17 +57,37 @@ def create_app(environ=None, start_response=None):
     from .main import main as main_blueprint
     app.register_blueprint(main_blueprint, url_prefix='/api')
 
-    # Create tables if they don't exist
-    with app.app_context():
-        db.create_all()
+    # Schema setup is an explicit step (flask --app app init-db, or
+    # flask --app app db upgrade) rather than a round trip on every startup
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Apply database migrations."""
+        upgrade()
+
+    @app.cli.command("archive-content")
+    @click.option("--days", type=int, default=None, help="Archive articles older than this (default ARCHIVE_AFTER_DAYS).")
+    @click.option("--drop", is_flag=True, help="Drop the full text instead of compressing it.")
+    def archive_content_command(days, drop):
+        """Compress or drop raw_content of old, summarized articles."""
+        from .archive import archive_contents, content_storage
+        before = content_storage()
+        archived = archive_contents(days, drop=drop)
+        after = content_storage()
+        click.echo(f"Archived {archived} articles")
+        for key in before:
+            click.echo(f"{key}: {before[key]} -> {after[key]}")
 
-    # Ensure the app is WSGI-compliant by returning it directly
     return app
 
-# Define a WSGI application object for Gunicorn with proper WSGI callable
-def application(environ, start_response):
-    app = create_app(environ, start_response)
-    return app(environ, start_response)
+_application = None
+_application_lock = threading.Lock()
 
-# Alternative: Use the direct Flask app as the WSGI application
-# application = create_app()
+# WSGI entry point for Gunicorn (app:application). The Flask app and its
+# SQLAlchemy engine are built on the first request and reused by the worker.
+def application(environ, start_response):
+    global _application
+    if _application is None:
+        with _application_lock:
+            if _application is None:
+                _application = create_app()
+    return _application(environ, start_response)
@@ -0,0 +1,83 @@
+"""Archival of old article text.
+
+Once an article has a current summary and is older than ARCHIVE_AFTER_DAYS,
+its raw_content is compressed into raw_content_archive (or dropped entirely)
+and the TEXT column is cleared. Article.content decompresses it again when the
+article has to be re-summarized.
+
+    flask --app app archive-content [--days N] [--drop]
+"""
+import logging
+import os
+import zlib
+from datetime import datetime, timedelta
+
+import sqlalchemy
+from sqlalchemy.orm import undefer_group
+
+from . import db
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_CONFIG = {
+    'after_days': int(os.getenv("ARCHIVE_AFTER_DAYS", "30")),
+    'batch_size': int(os.getenv("ARCHIVE_BATCH_SIZE", "500")),
+    'compression_level': 9
+}
+
+def compress_content(text):
+    return zlib.compress(text.encode("utf-8"), ARCHIVE_CONFIG['compression_level'])
+
+def content_storage():
+    """Bytes held in raw_content and raw_content_archive, plus the table's on-disk size on Postgres."""
+    text_bytes, archive_bytes, archived = db.session.query(
+        sqlalchemy.func.coalesce(sqlalchemy.func.sum(sqlalchemy.func.length(Article.raw_content)), 0),
+        sqlalchemy.func.coalesce(sqlalchemy.func.sum(sqlalchemy.func.length(Article.raw_content_archive)), 0),
+        sqlalchemy.func.count(Article.raw_content_archive)
+    ).one()
+    storage = {"raw_content_bytes": int(text_bytes), "archive_bytes": int(archive_bytes), "archived_articles": archived}
+    if db.engine.dialect.name == "postgresql":
+        # Includes TOAST; space freed by archiving is only returned after VACUUM
+        storage["table_bytes"] = db.session.execute(
+            sqlalchemy.text("SELECT pg_total_relation_size('rss_articles')")
+        ).scalar()
+    return storage
+
+def archive_contents(after_days=None, drop=False):
+    """Compress (or drop) raw_content of summarized articles older than after_days. Returns the count."""
+    after_days = ARCHIVE_CONFIG['after_days'] if after_days is None else after_days
+    cutoff = datetime.now() - timedelta(days=after_days)
+    archived = 0
+    while True:
+        # Archived rows leave the filter, so each batch starts from the top again
+        articles = (
+            Article.query
+            .filter(
+                Article.raw_content.isnot(None),
+                Article.summary_status == "done",
+                Article.summary_key.isnot(None),
+                Article.created_at < cutoff
+            )
+            .options(undefer_group("content"))
+            .order_by(Article.id)
+            .limit(ARCHIVE_CONFIG['batch_size'])
+            .all()
+        )
+        if not articles:
+            break
+        db.session.execute(
+            sqlalchemy.update(Article),
+            [
+                {
+                    "id": article.id,
+                    "raw_content": None,
+                    "raw_content_archive": None if drop else compress_content(article.raw_content)
+                }
+                for article in articles
+            ]
+        )
+        db.session.commit()
+        archived += len(articles)
+        logger.info("Archived %d articles", archived)
+    return archived
@@ -0,0 +1,110 @@
+import math
+import re
+
+from nltk.tokenize import wordpunct_tokenize
+
+# Approximate characters per model token for the subword pieces of a long word
+CHARS_PER_TOKEN = 4
+
+# Lines matching these are cookie banners, share widgets and similar page chrome
+BOILERPLATE_PATTERNS = re.compile(
+    r"cookie|consentement|accept(er|ez)? (all|tout)|tout accepter|privacy policy|politique de confidentialit"
+    r"|all rights reserved|tous droits r[ée]serv|newsletter|abonnez[- ]vous|subscribe|sign in|se connecter"
+    r"|partager sur|share on|lire aussi|read more|publicit[ée]|advertisement",
+    re.IGNORECASE
+)
+
+# Boilerplate lines are only dropped when short, so a real paragraph that
+# happens to mention a cookie survives
+MAX_BOILERPLATE_WORDS = 30
+
+# Runs of at least this many very short lines without punctuation are menus
+MIN_MENU_RUN = 3
+MAX_MENU_ITEM_WORDS = 4
+
+def estimate_tokens(text):
+    """Estimate how many model tokens `text` costs.
+
+    Words and punctuation are split like a subword tokenizer would see them,
+    and long words count as several tokens.
+    """
+    if not text:
+        return 0
+    return sum(max(1, math.ceil(len(token) / CHARS_PER_TOKEN)) for token in wordpunct_tokenize(text))
+
+def _is_menu_item(line):
+    return len(line.split()) <= MAX_MENU_ITEM_WORDS and not line.endswith((".", "!", "?", ":", "»", '"'))
+
+def _is_boilerplate(line):
+    return len(line.split()) <= MAX_BOILERPLATE_WORDS and bool(BOILERPLATE_PATTERNS.search(line))
+
+def strip_boilerplate(text):
+    """Drop navigation menus, cookie/subscription banners and repeated lines."""
+    if not text or not isinstance(text, str):
+        return ""
+
+    lines = [re.sub(r"\s+", " ", line).strip() for line in text.splitlines()]
+    lines = [line for line in lines if line]
+
+    kept = []
+    seen = set()
+    menu_run = []
+    for line in lines + [""]:
+        if line and _is_menu_item(line):
+            menu_run.append(line)
+            continue
+        # Too short a run for a menu: its lines are checked like any other
+        candidates = menu_run if len(menu_run) < MIN_MENU_RUN else []
+        menu_run = []
+
+        for candidate in candidates + [line]:
+            if not candidate or candidate in seen or _is_boilerplate(candidate):
+                continue
+            seen.add(candidate)
+            kept.append(candidate)
+
+    if not kept:
+        # Never empty a text entirely: a short article may just mention a newsletter
+        return "\n".join(dict.fromkeys(lines))
+    return "\n".join(kept)
+
+def _split_sentences(paragraph):
+    return re.split(r"(?<=[.!?])\s+", paragraph)
+
+def _split_words(sentence, max_tokens):
+    windows = [[]]
+    window_tokens = 0
+    for word in sentence.split():
+        tokens = estimate_tokens(word)
+        if windows[-1] and window_tokens + tokens > max_tokens:
+            windows.append([])
+            window_tokens = 0
+        windows[-1].append(word)
+        window_tokens += tokens
+    return [" ".join(window) for window in windows]
+
+def chunk_text(text, max_tokens):
+    """Split `text` into chunks of at most `max_tokens`, on paragraph, sentence, then word boundaries."""
+    chunks = []
+    current = ""
+    current_tokens = 0
+
+    for paragraph in text.split("\n"):
+        sentences = [paragraph] if estimate_tokens(paragraph) <= max_tokens else _split_sentences(paragraph)
+        separator = "\n"
+        for sentence in sentences:
+            # A single sentence over budget is cut into windows of words
+            pieces = [sentence] if estimate_tokens(sentence) <= max_tokens else _split_words(sentence, max_tokens)
+            for piece in pieces:
+                tokens = estimate_tokens(piece)
+                if current and current_tokens + tokens > max_tokens:
+                    chunks.append(current)
+                    current = ""
+                    current_tokens = 0
+                current += (separator if current else "") + piece
+                current_tokens += tokens
+                separator = " "
+
+    if current:
+        chunks.append(current)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
@@ -1,13 +1,28 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, g, has_request_context, jsonify, request, stream_with_context
+from werkzeug.http import is_resource_modified
 from . import db
 from .models import Article
+from .mistral import get_mistral_client
+from .metrics import metrics
+from .search import RANK_CANDIDATES, SEARCH_DIALECTS, search_articles
+from .content import strip_boilerplate, estimate_tokens, chunk_text
 from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
 import sqlalchemy
 import random
 import asyncio
+import gzip
+import hashlib
 import httpx
+import json
 import os
 import logging
+import time
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:  # Optional; responses fall back to gzip
+    brotli = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,27 +35,133 @@ api_key = os.getenv("MISTRAL_API_KEY")
 if not api_key:
     raise ValueError("MISTRAL_API_KEY environment variable not set")
 
-def truncate_text(text, max_tokens):
-    if not text or not isinstance(text, str):
-        return ""
-    words = text.split()
-    truncated_text = []
-    current_length = 0
-    for word in words:
-        current_length += len(word) + 1
-        if current_length > max_tokens:  # Match your Mistral prompt limit
-            break
-        truncated_text.append(word)
-    return ' '.join(truncated_text)
-
-async def generate_summary(raw_content, retry=3):
-    max_tokens = 16000
-    truncated_content = truncate_text(raw_content, max_tokens)
-    if not truncated_content.strip():
-        logger.warning("Empty or invalid raw_content provided for summary generation")
-        return "No summary available due to empty content"
+MISTRAL_MODEL = "mistral-large-latest"
+
+# Token budgets for summarization input. Articles over SUMMARY_TOKEN_BUDGET are
+# split into chunks that are summarized concurrently, then combined.
+SUMMARY_TOKEN_BUDGET = 4000
+CHUNK_TOKEN_BUDGET = 3000
+MAX_SUMMARY_CHUNKS = 6
+
+# Bump whenever the prompt wording changes so cached summaries are regenerated
+PROMPT_VERSION = "2"
+
+# Placeholder summaries returned on failure all start with this and are never cached
+SUMMARY_FALLBACK_PREFIX = "No summary available"
+
+summary_cache_stats = {"hits": 0, "misses": 0}
+
+# Article.summary_status values while an article sits in the summarization queue
+QUEUED_STATUSES = ("pending", "running")
+
+# Columns /api/articles may return; raw_content is deliberately not selectable
+ARTICLE_FIELDS = {
+    "id": Article.id,
+    "title": Article.title,
+    "summary": Article.summary,
+    "keyword": Article.keyword,
+    "status": Article.status,
+    "date": Article.date,
+    "link": Article.link,
+    "canonical_id": Article.canonical_id
+}
+DEFAULT_ARTICLE_FIELDS = ["id", "title", "summary", "keyword"]
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+DEFAULT_SEARCH_LIMIT = 20
+
+# Response compression for JSON bodies of at least COMPRESS_MIN_BYTES; brotli
+# is preferred when installed and accepted, gzip otherwise
+COMPRESS_MIN_BYTES = 500
+COMPRESSIBLE_MIMETYPES = ("application/json", "text/plain")
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# /api/results/stream checks pending summaries this often (seconds) and gives
+# up after RESULTS_STREAM_TIMEOUT; the client reconnects for what is left. An
+# open stream occupies a sync gunicorn worker, which gunicorn kills after its
+# --timeout (30 s by default), so keep the timeout below that
+RESULTS_STREAM_POLL_INTERVAL = float(os.getenv("RESULTS_STREAM_POLL_INTERVAL", "1"))
+RESULTS_STREAM_TIMEOUT = float(os.getenv("RESULTS_STREAM_TIMEOUT", "20"))
+
+@main.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@main.after_request
+def record_request_metrics(response):
+    # Streaming responses are measured up to the first byte
+    endpoint = request.endpoint or "unknown"
+    if "request_started" in g:
+        metrics.observe("http_request_seconds", time.perf_counter() - g.request_started, endpoint=endpoint)
+    metrics.inc("http_requests_total", endpoint=endpoint, method=request.method, status=response.status_code)
+    return response
+
+# Runs before record_request_metrics (after_request hooks run in reverse order),
+# so the request timing includes compression
+@main.after_request
+def compress_response(response):
+    if (response.direct_passthrough or response.is_streamed or not 200 <= response.status_code < 300
+            or "Content-Encoding" in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    if brotli is not None and request.accept_encodings["br"]:
+        encoding, body = "br", brotli.compress(data, quality=BROTLI_QUALITY)
+    elif request.accept_encodings["gzip"]:
+        encoding, body = "gzip", gzip.compress(data, compresslevel=GZIP_LEVEL)
+    else:
+        return response
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    # The compressed body is a different representation of the same resource
+    etag, _ = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    metrics.inc("http_compressed_bytes_total", len(data), encoding=encoding, stage="before")
+    metrics.inc("http_compressed_bytes_total", len(body), encoding=encoding, stage="after")
+    return response
+
+# Time every SQL statement, attributed to the route that issued it
+@sqlalchemy.event.listens_for(sqlalchemy.engine.Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+@sqlalchemy.event.listens_for(sqlalchemy.engine.Engine, "after_cursor_execute")
+def record_query_time(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    metrics.observe("db_query_seconds", elapsed, endpoint=request.endpoint if has_request_context() else "none")
+
+def prepare_content(raw_content):
+    """Return the cleaned article text and the chunks it should be summarized from."""
+    text = strip_boilerplate(raw_content)
+    if estimate_tokens(text) <= SUMMARY_TOKEN_BUDGET:
+        return text, [text] if text.strip() else []
+    chunks = chunk_text(text, CHUNK_TOKEN_BUDGET)[:MAX_SUMMARY_CHUNKS]
+    return "\n".join(chunks), chunks
+
+def content_hash(raw_content):
+    """sha256 of the article text; the scraper stores the same digest when it writes an article."""
+    return hashlib.sha256(raw_content.encode("utf-8")).hexdigest()
+
+def summary_cache_key(article_hash):
+    """Cache key of a summary, from the article's content_hash, the prompt version and the model."""
+    payload = "\0".join([PROMPT_VERSION, MISTRAL_MODEL, article_hash])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    prompt = (
+def build_chunk_prompt(chunk):
+    return (
+        "Résume fidèlement et de manière factuelle le passage suivant en 120 mots maximum, "
+        "sans introduction ni commentaire. Conserve les noms, les lieux et les chiffres importants.\n\n"
+        f"Passage : {chunk}"
+    )
+
+def build_prompt(content):
+    return (
         "Tu es un auteur inspiré, doté d'une plume unique et captivante. Je vais te fournir un texte, "
         "et ta mission est de le condenser en un résumé autonome, qui ne fait aucune référence à un article, à une source ou à un contexte extérieur. "
         "Voici tes consignes :\n\n"
@@ -50,42 +171,119 @@ async def generate_summary(raw_content, retry=3):
         "4. N'introduis pas le résumé avec des phrases comme 'Dans cet article' ou 'Il s'agit de'. "
         "Plonge directement dans le vif du sujet comme si tu présentais une réflexion ou une idée qui t'appartient.\n"
         "5. Évite toute redondance et fais ressortir l'essentiel de manière mémorable.\n\n"
-        f"Texte à résumer : {truncated_content}\n\n"
+        f"Texte à résumer : {content}\n\n"
         "Rends ce résumé percutant, créatif, et impossible à ignorer."
     )
 
+async def generate_summary(raw_content):
+    _, chunks = prepare_content(raw_content)
+    if not chunks:
+        logger.warning("Empty or invalid raw_content provided for summary generation")
+        return "No summary available due to empty content"
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.mistral.ai/v1/chat/completions",
-                headers={
-                    "Content-Type": "application/json; charset=utf-8",
-                    "Authorization": f"Bearer {api_key}"
-                },
-                json={
-                    "model": "mistral-large-latest",
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=httpx.Timeout(60.0)
-            )
-            response.raise_for_status()
-            response_data = response.json()
-            summary = response_data['choices'][0]['message']['content'].strip()
-            logger.info(f"Generated summary: {summary[:50]}...")  # Log first 50 chars of summary
-            return summary if summary and summary.strip() else "No summary available from Mistral"
-
-    except httpx.ReadTimeout as e:
-        logger.error(f"Timeout error generating summary: {e}")
-        if retry > 0:
-            logger.info("Retrying summary generation...")
-            await asyncio.sleep(2)  # Wait before retry
-            return await generate_summary(raw_content, retry=retry-1)
+        # Retries on 429/5xx and timeouts happen inside the shared client
+        client = get_mistral_client(api_key)
+        if len(chunks) == 1:
+            text = chunks[0]
+        else:
+            # Map-reduce: condense each chunk concurrently, then write the summary from the digests
+            with metrics.timer("summary_stage_seconds", stage="map"):
+                partials = await asyncio.gather(*[client.complete(MISTRAL_MODEL, build_chunk_prompt(chunk)) for chunk in chunks])
+            text = "\n\n".join(partials)
+            logger.info("Condensed %d chunks before summarizing", len(chunks))
+        with metrics.timer("summary_stage_seconds", stage="summarize"):
+            summary = await client.complete(MISTRAL_MODEL, build_prompt(text))
+        logger.debug("Generated summary: %.50s...", summary)
+        metrics.inc("summaries_total", result="generated")
+        return summary if summary and summary.strip() else "No summary available from Mistral"
+
+    except httpx.TimeoutException as e:
+        logger.error("Timeout error generating summary: %s", e)
+        metrics.inc("summaries_total", result="timeout")
         return "No summary available due to timeout error"
 
     except Exception as e:
-        logger.error(f"Error generating summary: {e}")
+        logger.error("Error generating summary: %s", e)
+        metrics.inc("summaries_total", result="error")
         return "No summary available due to an unexpected error"
 
+def queue_summaries(articles, force=False):
+    """Mark articles whose cached summary is missing or stale as pending for the worker.
+
+    A cached summary is checked against the stored content_hash, so the article
+    text is only loaded (deferred, one query per article) for rows that may need
+    queuing or predate content_hash.
+    """
+    queued = 0
+    for article in articles:
+        if article.summary_status in QUEUED_STATUSES:
+            continue
+        cached = not force and article.summary
+        if cached and article.content_hash and article.summary_key == summary_cache_key(article.content_hash):
+            summary_cache_stats["hits"] += 1
+            metrics.inc("summary_cache_total", result="hit")
+            continue
+        content = article.content
+        if not (content and content.strip()):
+            continue
+        if not article.content_hash:
+            article.content_hash = content_hash(content)
+        summary_cache_stats["misses"] += 1
+        metrics.inc("summary_cache_total", result="miss")
+        article.summary_status = "pending"
+        queued += 1
+    return queued
+
+def queue_new_summaries(article_ids):
+    """Set-based counterpart of queue_summaries for articles that were never summarized.
+
+    Summaries made stale by a prompt or model change are caught by queue_summaries
+    the next time /results is read.
+    """
+    if not article_ids:
+        return 0
+    result = db.session.execute(
+        sqlalchemy.update(Article)
+        .where(
+            Article.id.in_(article_ids),
+            sqlalchemy.func.coalesce(Article.summary_status, "").not_in(QUEUED_STATUSES),
+            sqlalchemy.func.coalesce(sqlalchemy.func.trim(Article.raw_content), "") != "",
+            sqlalchemy.or_(Article.summary.is_(None), Article.summary_key.is_(None))
+        )
+        .values(summary_status="pending", updated_at=sqlalchemy.func.now())
+    )
+    summary_cache_stats["misses"] += result.rowcount
+    metrics.inc("summary_cache_total", result.rowcount, result="miss")
+    return result.rowcount
+
+def result_entry(article_id, title, summary, summary_status):
+    """One /results entry; pending covers both queued and running summaries."""
+    if summary_status in QUEUED_STATUSES:
+        state = "pending"
+    elif summary_status == "failed":
+        state = "failed"
+    else:
+        state = "done"
+    return {"id": article_id, "title": title, "summary": summary or "No summary available", "status": state}
+
+def requested_fields():
+    # ?fields=id,title,... (always including id), validated by the caller against ARTICLE_FIELDS
+    fields = request.args.get("fields")
+    fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else DEFAULT_ARTICLE_FIELDS
+    return fields if "id" in fields else ["id"] + fields
+
+def article_filters():
+    # ?status= and ?keyword=; near-duplicates are hidden unless ?duplicates=1
+    filters = []
+    if request.args.get("duplicates", "").lower() not in ("1", "true", "yes"):
+        filters.append(Article.canonical_id.is_(None))
+    if request.args.get("status"):
+        filters.append(Article.status == request.args["status"])
+    if request.args.get("keyword"):
+        filters.append(Article.keyword == request.args["keyword"])
+    return filters
+
 @retry(
     stop=stop_after_attempt(10),
     wait=wait_exponential(multiplier=2, min=2, max=60) + wait_random(0, 1),
@@ -93,8 +291,62 @@ async def generate_summary(raw_content, retry=3):
 )
 @main.route("/articles", methods=["GET"])
 def get_articles():
-    articles = Article.query.all()
-    return jsonify([{"id": a.id, "title": a.title, "summary": a.summary, "keyword": a.keyword} for a in articles])
+    # Keyset pagination: ?after=<last id seen>&limit=N, filtered by status,
+    # keyword and date range, projected to ?fields=id,title,... Near-duplicates
+    # of another article are hidden unless ?duplicates=1.
+    try:
+        limit = min(int(request.args.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        after = int(request.args.get("after", 0))
+        since = request.args.get("since")
+        until = request.args.get("until")
+        for value in (since, until):
+            if value:
+                datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return jsonify({"error": "limit and after must be integers, since and until YYYY-MM-DD dates"}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be positive"}), 400
+
+    fields = requested_fields()
+    unknown = [f for f in fields if f not in ARTICLE_FIELDS]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    filters = article_filters()
+    if since:
+        filters.append(Article.date >= since)
+    if until:
+        filters.append(Article.date <= until)
+
+    # Answer conditional requests from one aggregate query, before loading any rows
+    count, last_modified = (
+        db.session.query(sqlalchemy.func.count(Article.id), sqlalchemy.func.max(Article.updated_at))
+        .filter(*filters)
+        .one()
+    )
+    etag = hashlib.sha1(f"{count}:{last_modified}:{request.query_string.decode()}".encode()).hexdigest()
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        rows = (
+            db.session.query(*[ARTICLE_FIELDS[f] for f in fields])
+            .filter(Article.id > after, *filters)
+            .order_by(Article.id)
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        articles = [dict(zip(fields, row)) for row in rows[:limit]]
+        response = jsonify({
+            "articles": articles,
+            "next_cursor": articles[-1]["id"] if has_more else None
+        })
+
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
 
 @retry(
     stop=stop_after_attempt(10),
@@ -113,24 +365,42 @@ def update_selection():
             logger.error("Selections must be a dictionary")
             return jsonify({"error": "Invalid data format"}), 400
 
+        # Validate the whole payload before touching the database
+        ids_by_status = {"in": set(), "out": set()}
         for article_id, status in selections.items():
             try:
                 article_id = int(article_id)  # Ensure article_id is an integer
-                article = Article.query.get(article_id)
-                if article:
-                    article.status = "in" if status == "in" else "out"
-                else:
-                    logger.warning(f"Article with ID {article_id} not found")
             except ValueError:
-                logger.error(f"Invalid article ID: {article_id}")
+                logger.error("Invalid article ID: %s", article_id)
                 return jsonify({"error": f"Invalid article ID: {article_id}"}), 400
+            if status not in ids_by_status:
+                logger.error("Invalid status for article %s: %s", article_id, status)
+                return jsonify({"error": f"Invalid status for article {article_id}: {status}"}), 400
+            ids_by_status[status].add(article_id)
+
+        requested = ids_by_status["in"] | ids_by_status["out"]
+        known = set(db.session.scalars(sqlalchemy.select(Article.id).where(Article.id.in_(requested)))) if requested else set()
+        unknown = sorted(requested - known)
+        if unknown:
+            logger.warning("Articles not found: %s", unknown)
+
+        # One set-based UPDATE per target status, touching only rows that change
+        for status, ids in ids_by_status.items():
+            ids &= known
+            if ids:
+                db.session.execute(
+                    sqlalchemy.update(Article)
+                    .where(Article.id.in_(ids), Article.status.is_distinct_from(status))
+                    .values(status=status, updated_at=sqlalchemy.func.now())
+                )
 
+        queued = queue_new_summaries(ids_by_status["in"])
         db.session.commit()
-        logger.info("Selection saved successfully")
-        return jsonify({"message": "Selection saved"})
+        logger.info("Selection saved successfully, %d summaries queued", queued)
+        return jsonify({"message": "Selection saved", "queued": queued, "unknown_ids": unknown})
 
     except Exception as e:
-        logger.error(f"Error processing update-selection: {str(e)}")
+        logger.error("Error processing update-selection: %s", e)
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
@@ -140,40 +410,145 @@ def update_selection():
     retry=retry_if_exception_type((sqlalchemy.exc.OperationalError,))
 )
 @main.route("/results", methods=["GET"])
-async def get_results():
-    # First, get articles with status "in"
-    articles = Article.query.filter_by(status="in").all()
-    logger.info(f"Found {len(articles)} articles with status 'in'")
-    
-    # Generate summaries for all "in" articles using Mistral, forcing updates if raw_content exists
-    tasks = []
-    for article in articles:
-        logger.debug(f"Processing article: {article.title}")
-        if article.raw_content and article.raw_content.strip():
-            tasks.append(generate_summary(article.raw_content))
-        else:
-            tasks.append(asyncio.Future())
-            tasks[-1].set_result(article.summary or "No raw content available for summary")
-
-    summaries = await asyncio.gather(*tasks)
-
-    # Update articles with new summaries and log each update
-    updated_count = 0
-    for article, summary in zip(articles, summaries):
-        if article.raw_content and article.raw_content.strip():
-            article.summary = summary if summary and summary.strip() else "No summary available"
-            updated_count += 1
-            logger.info(f"Updated summary for article '{article.title}': {summary[:50]}...")
-        else:
-            logger.warning(f"No raw_content for article '{article.title}', kept summary: {article.summary or 'None'}")
-    db.session.commit()
-    logger.info(f"Updated {updated_count} article summaries")
+def get_results():
+    force_refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
 
-    # Return results, ensuring summaries are included even if empty or default
-    results = [{"title": a.title, "summary": a.summary or "No summary available"} for a in articles]
-    logger.debug(f"Returning results: {results}")
+    # Summaries are produced by the worker (python -m app.worker); this only
+    # queues stale ones and reports where each article stands.
+    articles = Article.query.filter_by(status="in").all()
+    queued = queue_summaries(articles, force=force_refresh)
+    # Built before the commit, which would expire every article and reload it
+    results = [result_entry(a.id, a.title, a.summary, a.summary_status) for a in articles]
+    if db.session.dirty:
+        db.session.commit()
+    logger.info("Found %d articles with status 'in', %d newly queued for summary", len(articles), queued)
     return jsonify(results)
 
+@retry(
+    stop=stop_after_attempt(10),
+    wait=wait_exponential(multiplier=2, min=2, max=60) + wait_random(0, 1),
+    retry=retry_if_exception_type((sqlalchemy.exc.OperationalError,))
+)
+@main.route("/results/stream", methods=["GET"])
+def stream_results():
+    # Streaming /results: one line per article, cached summaries first and pending
+    # placeholders after them, then each pending one again as soon as the worker
+    # stores it. NDJSON by default, server-sent events with ?format=sse or
+    # Accept: text/event-stream.
+    force_refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
+    sse = request.args.get("format") == "sse" or request.accept_mimetypes.best == "text/event-stream"
+
+    articles = Article.query.filter_by(status="in").all()
+    queued = queue_summaries(articles, force=force_refresh)
+    entries = [result_entry(a.id, a.title, a.summary, a.summary_status) for a in articles]
+    if db.session.dirty:
+        db.session.commit()
+    logger.info("Streaming results for %d articles, %d newly queued for summary", len(articles), queued)
+
+    pending_ids = [entry["id"] for entry in entries if entry["status"] == "pending"]
+    # Cached summaries first, then a pending placeholder for each of the rest so
+    # the client can list and count them until their summary line arrives
+    entries.sort(key=lambda entry: entry["status"] == "pending")
+    # Release the connection before the response starts streaming
+    db.session.rollback()
+
+    def encode(event, payload):
+        data = json.dumps(payload, ensure_ascii=False)
+        return f"event: {event}\ndata: {data}\n\n" if sse else data + "\n"
+
+    def generate():
+        for entry in entries:
+            yield encode("result", entry)
+
+        pending = set(pending_ids)
+        deadline = time.monotonic() + RESULTS_STREAM_TIMEOUT
+        while pending and time.monotonic() < deadline:
+            time.sleep(RESULTS_STREAM_POLL_INTERVAL)
+            rows = (
+                db.session.query(Article.id, Article.title, Article.summary, Article.summary_status)
+                .filter(Article.id.in_(pending), sqlalchemy.func.coalesce(Article.summary_status, "").not_in(QUEUED_STATUSES))
+                .all()
+            )
+            # End the read transaction so the next poll sees new commits and the
+            # connection goes back to the pool while sleeping
+            db.session.rollback()
+            for row in rows:
+                pending.discard(row.id)
+                yield encode("result", result_entry(*row))
+            if not rows and sse:
+                yield ": keep-alive\n\n"
+
+        yield encode("end", {"pending": sorted(pending)})
+
+    response = current_app.response_class(
+        stream_with_context(generate()),
+        mimetype="text/event-stream" if sse else "application/x-ndjson"
+    )
+    response.cache_control.no_cache = True
+    response.headers["X-Accel-Buffering"] = "no"  # Stop proxies from buffering the stream
+    return response
+
+@retry(
+    stop=stop_after_attempt(10),
+    wait=wait_exponential(multiplier=2, min=2, max=60) + wait_random(0, 1),
+    retry=retry_if_exception_type((sqlalchemy.exc.OperationalError,))
+)
+@main.route("/search", methods=["GET"])
+def search():
+    # Ranked full-text search over title, summary and article text:
+    # ?q=words "a phrase" or -excluded&limit=N&offset=M, with the fields and
+    # status/keyword/duplicates filters of /articles. Each result has a rank.
+    # Only the newest RANK_CANDIDATES matches are ranked and paged through,
+    # which keeps words found in most articles as fast as rare ones;
+    # "truncated" tells when older matches were left out, and ?exhaustive=1
+    # ranks every match instead (slower for common words).
+    if db.engine.dialect.name not in SEARCH_DIALECTS:
+        return jsonify({"error": f"Search is not supported on {db.engine.dialect.name}"}), 501
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+    try:
+        limit = min(int(request.args.get("limit", DEFAULT_SEARCH_LIMIT)), MAX_PAGE_SIZE)
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return jsonify({"error": "limit and offset must be integers"}), 400
+    if limit < 1 or offset < 0:
+        return jsonify({"error": "limit must be positive and offset not negative"}), 400
+
+    fields = requested_fields()
+    unknown = [f for f in fields if f not in ARTICLE_FIELDS]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    candidates = None if request.args.get("exhaustive", "").lower() in ("1", "true", "yes") else RANK_CANDIDATES
+    rows, truncated = search_articles(
+        query, [ARTICLE_FIELDS[f] for f in fields], article_filters(), limit + 1, offset, candidates
+    )
+    has_more = len(rows) > limit
+    results = []
+    for row in rows[:limit]:
+        result = dict(zip(fields, row))
+        result["rank"] = float(row.rank)
+        results.append(result)
+    return jsonify({
+        "results": results,
+        "next_offset": offset + limit if has_more else None,
+        "truncated": truncated
+    })
+
+@main.route("/summary-cache", methods=["GET"])
+def get_summary_cache_stats():
+    total = summary_cache_stats["hits"] + summary_cache_stats["misses"]
+    hit_rate = summary_cache_stats["hits"] / total if total else 0.0
+    return jsonify({**summary_cache_stats, "hit_rate": round(hit_rate, 3)})
+
+@main.route("/metrics", methods=["GET"])
+def get_metrics():
+    # Metrics of this process only; each gunicorn worker keeps its own
+    if request.args.get("format") == "json":
+        return jsonify(metrics.snapshot())
+    return current_app.response_class(metrics.render(), mimetype="text/plain; version=0.0.4")
+
 # Ensure async compatibility for WSGI (Gunicorn handles this on Render)
 from werkzeug.middleware.dispatcher import DispatcherMiddleware  # Updated import
 from werkzeug.serving import run_simple
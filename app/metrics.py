@@ -0,0 +1,143 @@
+"""In-process counters, histograms and stage timers.
+
+Each process keeps its own registry (every gunicorn worker, the scraper and
+the summary worker). The web app renders it in the Prometheus text format at
+/api/metrics; the scraper and worker log a summary when they exit.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds, from a cache hit to a slow page load or Mistral call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile (the max for the +Inf bucket)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self.started = time.time()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        # Label values are strings in the exposition format anyway; keeping
+        # them as given would let status=429 and status="transport_error"
+        # share a series and break sorting
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the wall time of the block in seconds; works around awaits too."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    @staticmethod
+    def _series(name: str, labels: tuple, extra: tuple = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return name
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+        return name + '{' + ','.join(f'{label}="{value}"' for (label, _), value in zip(pairs, escaped)) + '}'
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+            typed = set()
+            for (name, labels), value in counters:
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{self._series(name, labels)} {value}")
+            for (name, labels), histogram in histograms:
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f"{self._series(name + '_bucket', labels, (('le', bound),))} {cumulative}")
+                lines.append(f"{self._series(name + '_sum', labels)} {histogram.sum:.6f}")
+                lines.append(f"{self._series(name + '_count', labels)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> dict:
+        """Counters and per-series histogram summaries, keyed by series name."""
+        with self._lock:
+            return {
+                'uptime_s': round(time.time() - self.started, 1),
+                'counters': {self._series(name, labels): value for (name, labels), value in sorted(self._counters.items())},
+                'timings': {
+                    self._series(name, labels): {
+                        'count': h.count,
+                        'total_s': round(h.sum, 3),
+                        'mean_s': round(h.sum / h.count, 4) if h.count else 0.0,
+                        'p50_s': round(h.quantile(0.5), 4),
+                        'p95_s': round(h.quantile(0.95), 4),
+                        'max_s': round(h.max, 4)
+                    }
+                    for (name, labels), h in sorted(self._histograms.items())
+                }
+            }
+
+    def summary(self) -> str:
+        """Multi-line run summary for logs, slowest stages first."""
+        snapshot = self.snapshot()
+        timings = sorted(snapshot['timings'].items(), key=lambda item: item[1]['total_s'], reverse=True)
+        lines = [f"{series}: n={t['count']} total={t['total_s']}s mean={t['mean_s']}s "
+                 f"p50<={t['p50_s']}s p95<={t['p95_s']}s max={t['max_s']}s" for series, t in timings]
+        lines += [f"{series} = {value}" for series, value in snapshot['counters'].items()]
+        return '\n'.join(lines)
+
+metrics = Metrics()
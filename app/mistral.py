@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+MISTRAL_CONFIG = {
+    'base_url': os.getenv("MISTRAL_BASE_URL", "https://api.mistral.ai"),
+    'max_concurrency': int(os.getenv("MISTRAL_MAX_CONCURRENCY", "4")),
+    'requests_per_second': float(os.getenv("MISTRAL_REQUESTS_PER_SECOND", "1")),
+    'burst': int(os.getenv("MISTRAL_BURST", "2")),
+    'max_retries': int(os.getenv("MISTRAL_MAX_RETRIES", "5")),
+    'backoff_base': 1.0,
+    'backoff_max': 60.0,
+    'timeout': 60.0
+}
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class MistralClient:
+    """Long-lived chat completions client with connection reuse, a concurrency cap,
+    a token-bucket rate limit and retries on 429/5xx that honor Retry-After.
+
+    Pass `transport` (e.g. httpx.MockTransport) or point `base_url` at a local
+    server to exercise it without the real API.
+    """
+
+    def __init__(self, api_key: str, base_url: str = None, transport=None, max_concurrency: int = None,
+                 requests_per_second: float = None, burst: int = None, max_retries: int = None):
+        self.max_retries = MISTRAL_CONFIG['max_retries'] if max_retries is None else max_retries
+        self.http = httpx.AsyncClient(
+            base_url=base_url or MISTRAL_CONFIG['base_url'],
+            headers={
+                "Content-Type": "application/json; charset=utf-8",
+                "Authorization": f"Bearer {api_key}"
+            },
+            timeout=httpx.Timeout(MISTRAL_CONFIG['timeout']),
+            transport=transport
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency or MISTRAL_CONFIG['max_concurrency'])
+        self.bucket = TokenBucket(
+            MISTRAL_CONFIG['requests_per_second'] if requests_per_second is None else requests_per_second,
+            burst or MISTRAL_CONFIG['burst']
+        )
+        self.stats = Counter()
+
+    async def complete(self, model: str, prompt: str) -> str:
+        payload = {"model": model, "messages": [{"role": "user", "content": prompt}]}
+
+        for attempt in range(self.max_retries + 1):
+            async with self.semaphore:
+                await self.bucket.acquire()
+                self.stats["requests"] += 1
+                started = time.perf_counter()
+                try:
+                    response = await self.http.post("/v1/chat/completions", json=payload)
+                except httpx.TransportError as e:
+                    self.stats["transport_errors"] += 1
+                    metrics.inc("mistral_requests_total", status="transport_error")
+                    if attempt == self.max_retries:
+                        raise
+                    logger.warning("Mistral request failed (%r), retrying", e)
+                    delay = self._backoff(attempt)
+                else:
+                    metrics.observe("mistral_request_seconds", time.perf_counter() - started)
+                    metrics.inc("mistral_requests_total", status=response.status_code)
+                    if response.status_code != 429 and response.status_code < 500:
+                        response.raise_for_status()
+                        return response.json()['choices'][0]['message']['content'].strip()
+
+                    self.stats[f"status_{response.status_code}"] += 1
+                    if attempt == self.max_retries:
+                        response.raise_for_status()
+                    delay = self._retry_after(response)
+                    if delay is None:
+                        delay = self._backoff(attempt)
+                    logger.warning("Mistral returned %d, retrying in %.1fs", response.status_code, delay)
+
+            # Sleep outside the semaphore so waiting retries do not block other calls
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        delay = MISTRAL_CONFIG['backoff_base'] * (2 ** attempt)
+        return min(MISTRAL_CONFIG['backoff_max'], delay) + random.uniform(0, 1)
+
+    @staticmethod
+    def _retry_after(response):
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return min(MISTRAL_CONFIG['backoff_max'], max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+        return min(MISTRAL_CONFIG['backoff_max'], max(0.0, retry_at - time.time()))
+
+    async def aclose(self):
+        await self.http.aclose()
+
+_client = None
+_client_loop = None
+
+def get_mistral_client(api_key: str) -> MistralClient:
+    """Return the shared client for the running event loop.
+
+    httpx and asyncio primitives are bound to the loop they were created on, so a
+    new client is built if the caller runs on a different loop than the last one.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = MistralClient(api_key)
+        _client_loop = loop
+    return _client
+
+async def close_mistral_client():
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
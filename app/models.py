@@ -1,3 +1,5 @@
+import zlib
+
 from . import db
 
 class Article(db.Model):
@@ -5,14 +7,69 @@ class Article(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.Text)
     title = db.Column(db.Text, nullable=False)
-    raw_content = db.Column(db.Text)
+    raw_content = db.deferred(db.Column(db.Text), group="content")  # Large; only loaded when summarizing
+    # zlib-compressed raw_content of archived articles (raw_content is then NULL), see app/archive.py
+    raw_content_archive = db.deferred(db.Column(db.LargeBinary), group="content")
     summary = db.Column(db.Text)  # Ensure this is present for Mistral summaries
+    summary_key = db.Column(db.Text)  # Hash of content_hash, prompt version and model, see summary_cache_key
+    summary_status = db.Column(db.Text)  # Summarization queue state: pending, running, done or failed
     keyword = db.Column(db.Text)
+    content_hash = db.Column(db.Text)  # sha256 of the article text, set when it is stored or summarized
     link = db.Column(db.Text, unique=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    status = db.Column(db.Text, default="out")
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+    status = db.Column(db.Text, default="out", server_default="out")
+    # Set on near-duplicates (syndicated copies) to the article they repeat; NULL for originals
+    canonical_id = db.Column(db.Integer, db.ForeignKey("rss_articles.id", ondelete="SET NULL"))
+
+    # link is indexed by its UNIQUE constraint; keep this in sync with the
+    # migrations and DatabaseManager.init_db in scraper.py
+    __table_args__ = (
+        db.Index('idx_rss_articles_status', 'status'),
+        db.Index('idx_rss_articles_created_at', 'created_at'),
+        db.Index('idx_rss_articles_date', 'date'),
+        db.Index('idx_rss_articles_canonical_id', 'canonical_id'),
+    )
 
-    __table_args__ = (db.Index('idx_link', 'link'),)
+    @property
+    def content(self):
+        """Full article text, decompressed when it has been archived. Load with undefer_group("content")."""
+        if self.raw_content is None and self.raw_content_archive is not None:
+            return zlib.decompress(self.raw_content_archive).decode("utf-8")
+        return self.raw_content
 
     def __repr__(self):
         return f"<Article {self.title}>"
+
+class Feed(db.Model):
+    __tablename__ = "rss_feeds"
+    url = db.Column(db.Text, primary_key=True)
+    enabled = db.Column(db.Boolean, nullable=False, default=True, server_default=db.true())
+    etag = db.Column(db.Text)  # Validators from the last response, sent back as a conditional GET
+    modified = db.Column(db.Text)
+    seen_ids = db.Column(db.Text)  # JSON list of entry ids already handed to the scraper
+    poll_interval = db.Column(db.Integer)  # Seconds between polls in daemon mode; NULL uses the default
+    last_polled_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f"<Feed {self.url}>"
+
+class ArticleFingerprint(db.Model):
+    __tablename__ = "article_fingerprints"
+    article_id = db.Column(db.Integer, db.ForeignKey("rss_articles.id", ondelete="CASCADE"), primary_key=True)
+    signature = db.Column(db.LargeBinary, nullable=False)  # MinHash signature, see minhash_signature in scraper.py
+
+class ArticleFingerprintBand(db.Model):
+    # One row per LSH band; articles sharing a band_hash are near-duplicate candidates
+    __tablename__ = "article_fingerprint_bands"
+    band_hash = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    article_id = db.Column(db.Integer, db.ForeignKey("article_fingerprints.article_id", ondelete="CASCADE"), primary_key=True)
+
+class BrowserDomain(db.Model):
+    # Domains learned by the scraper to need JavaScript; their pages skip the HTTP tier
+    __tablename__ = "browser_domains"
+    domain = db.Column(db.Text, primary_key=True)
+    learned_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    def __repr__(self):
+        return f"<BrowserDomain {self.domain}>"
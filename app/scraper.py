@@ -1,11 +1,28 @@
 import asyncio
 import asyncpg
 import feedparser
-from playwright.async_api import async_playwright
+import httpx
+from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import logging
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
+import argparse
+import hashlib
+import json
 import os
+import random
+import re
+import signal
+import struct
+import time
+
+try:
+    from .metrics import metrics
+except ImportError:
+    # Run as a script (python app/scraper.py) rather than as app.scraper
+    from metrics import metrics
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -19,51 +36,611 @@ RSS_FEEDS = [
     "https://www.google.com/alerts/feeds/10761550076048473387/15297762454452931038"
 ]
 
+# Feeds can also come from RSS_FEEDS (comma or whitespace separated) or a file
+# named by RSS_FEEDS_FILE, one URL per line; either replaces the list above.
+# rss_feeds follows the configured list on every run: new feeds are added and
+# rows missing from the list are disabled, keeping their state in case they
+# come back.
+
 # Configuration
 CONFIG = {
     'max_concurrent_scrapes': 2,
+    'max_scrapes_per_domain': 1,
+    'max_requests_per_second': 2.0,
     'max_retries': 2,
     'retry_delay': 2,
     'db_timeout': 60,
+    'db_pool_min_size': 1,
+    'db_pool_max_size': 4,
+    'insert_batch_size': 20,
     'page_load_timeout': 20000,
+    'content_wait_timeout': 5000,
+    'http_timeout': 15,
+    'http_max_connections': 10,
+    'max_seen_ids_per_feed': 200,
+    'feed_poll_interval': 900,
+    'feed_poll_jitter': 0.1,
+    'context_max_pages': 200,
+    'browser_max_rss_mb': 1500,
+    'daemon_error_backoff': 30,
+    'daemon_max_error_backoff': 900,
+    'latency_window': 1000,
+    'health_file': os.getenv('SCRAPER_HEALTH_FILE', '/tmp/scraper_health.json'),
+    'metrics_file': os.getenv('SCRAPER_METRICS_FILE'),
+    'shingle_size': 5,
+    'fingerprint_min_words': 50,
+    'near_duplicate_similarity': 0.6,
+    'min_content_length': 500,
+    'browser_only_domains': [],
+    'block_resources': True,
+    'blocked_resource_types': ['image', 'media', 'font'],
+    'blocked_host_patterns': [
+        'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com', 'google-analytics.com',
+        'googleadservices.com', 'adservice.google.', 'amazon-adsystem.com', 'facebook.net',
+        'scorecardresearch.com', 'criteo.', 'taboola.com', 'outbrain.com', 'hotjar.com', 'chartbeat.'
+    ],
+    'allowed_host_patterns': [],
     'wait_after_navigation': 1000,
     'stealth_mode': True
 }
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+
+REQUEST_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Candidate containers for article text, in order of preference
+CONTENT_SELECTORS = [
+    'article',
+    'main',
+    '.article-content',
+    '.content',
+    '#article-content',
+    '.article-body',
+    '.post-content'
+]
+
+# Block elements put on lines of their own in HTTP-tier text, so line-based
+# cleaning (content.strip_boilerplate) sees paragraphs rather than one long line
+BLOCK_TAGS = ['p', 'div', 'section', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre',
+              'figcaption', 'tr']
+
+# Page chrome stripped before falling back to bare paragraphs
+BOILERPLATE_SELECTORS = 'header, footer, nav, aside, .ads, .advertisement, .social-share'
+
+# Cookie/consent buttons clicked in the page before extracting
+CONSENT_SELECTORS = '#cookie-accept, .cookie-button, button, [role="button"]'
+CONSENT_TEXT_PATTERN = 'accept|i agree'
+
+# Runs in the page as one evaluate: dismisses a consent banner, reads metadata,
+# strips page chrome and returns the text of the node with the densest prose.
+# Paragraphs credit their parent and (halved) grandparent, like Readability;
+# class/id hints and link density then adjust each candidate's score.
+EXTRACTION_SCRIPT = """({boilerplate, consentSelectors, consentPattern}) => {
+    const consent = new RegExp(consentPattern, 'i');
+    const button = Array.from(document.querySelectorAll(consentSelectors)).find(el => {
+        const label = (el.innerText || '').trim();
+        return el.getClientRects().length > 0
+            && (el.matches('#cookie-accept, .cookie-button') || (label.length < 40 && consent.test(label)));
+    });
+    if (button) button.click();
+
+    const meta = name => {
+        const el = document.querySelector(`meta[property="${name}"], meta[name="${name}"]`);
+        return el ? el.content : null;
+    };
+    const heading = document.querySelector('h1');
+    const time = document.querySelector('time[datetime]');
+    const result = {
+        dismissed: Boolean(button),
+        title: meta('og:title') || (heading ? heading.innerText.trim() : document.title),
+        published: meta('article:published_time') || (time ? time.getAttribute('datetime') : null),
+        author: meta('author'),
+        lang: document.documentElement.lang || null
+    };
+
+    document.querySelectorAll(boilerplate).forEach(el => el.remove());
+
+    const scores = new Map();
+    for (const p of document.querySelectorAll('p, pre, blockquote')) {
+        const text = p.textContent.trim();
+        if (text.length < 25) continue;
+        const score = 1 + text.split(/[,.;!?]/).length + Math.min(text.length / 100, 3);
+        const parent = p.parentElement;
+        if (!parent) continue;
+        scores.set(parent, (scores.get(parent) || 0) + score);
+        if (parent.parentElement) {
+            scores.set(parent.parentElement, (scores.get(parent.parentElement) || 0) + score / 2);
+        }
+    }
+
+    const positive = /article|content|body|post|story|entry|text/i;
+    const negative = /comment|footer|sidebar|related|share|promo|newsletter|widget|menu|nav/i;
+    let best = null;
+    let bestScore = 0;
+    for (const [node, base] of scores) {
+        const label = (node.getAttribute('class') || '') + ' ' + node.id;
+        let score = base + (node.tagName === 'ARTICLE' || node.tagName === 'MAIN' ? 10 : 0);
+        if (positive.test(label)) score += 25;
+        if (negative.test(label)) score -= 25;
+        const length = node.textContent.length || 1;
+        let links = 0;
+        node.querySelectorAll('a').forEach(a => { links += a.textContent.length; });
+        score *= 1 - Math.min(links / length, 1);
+        if (score > bestScore) {
+            best = node;
+            bestScore = score;
+        }
+    }
+
+    result.text = best
+        ? best.innerText
+        : Array.from(document.getElementsByTagName('p')).map(p => p.innerText).join('\\n');
+    result.score = Math.round(bestScore);
+    result.candidates = scores.size;
+    return result;
+}"""
+
+# Resolves once the page holds at least minLength characters of paragraph text
+CONTENT_READY_SCRIPT = """(minLength) => {
+    let total = 0;
+    for (const p of document.getElementsByTagName('p')) {
+        total += p.textContent.length;
+        if (total >= minLength) return true;
+    }
+    return false;
+}"""
+
+# Rough transfer sizes used to estimate bytes saved by blocked requests,
+# since an aborted request never reports its real size
+TYPICAL_RESOURCE_BYTES = {
+    'image': 60000,
+    'media': 500000,
+    'font': 40000,
+    'script': 30000,
+    'stylesheet': 20000
+}
+
+# Same schema as the Article model and the Flask-Migrate migrations; link is
+# indexed by its UNIQUE constraint, so no separate index is declared for it
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS rss_articles (
+        id SERIAL PRIMARY KEY,
+        date TEXT,
+        title TEXT NOT NULL,
+        raw_content TEXT,
+        summary TEXT,
+        summary_key TEXT,
+        summary_status TEXT,
+        keyword TEXT,
+        link TEXT UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'out',
+        canonical_id INTEGER REFERENCES rss_articles (id) ON DELETE SET NULL,
+        raw_content_archive BYTEA,
+        content_hash TEXT
+    );
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS summary_key TEXT;
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS summary_status TEXT;
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+    DROP INDEX IF EXISTS idx_link;
+    ALTER TABLE rss_articles DROP CONSTRAINT IF EXISTS rss_articles_link_key1;
+    CREATE INDEX IF NOT EXISTS idx_rss_articles_status ON rss_articles (status);
+    CREATE INDEX IF NOT EXISTS idx_rss_articles_created_at ON rss_articles (created_at);
+    CREATE INDEX IF NOT EXISTS idx_rss_articles_date ON rss_articles (date);
+    CREATE TABLE IF NOT EXISTS rss_feeds (
+        url TEXT PRIMARY KEY,
+        enabled BOOLEAN NOT NULL DEFAULT true,
+        etag TEXT,
+        modified TEXT,
+        seen_ids TEXT,
+        poll_interval INTEGER,
+        last_polled_at TIMESTAMP
+    );
+    ALTER TABLE rss_feeds ADD COLUMN IF NOT EXISTS poll_interval INTEGER;
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS canonical_id INTEGER REFERENCES rss_articles (id) ON DELETE SET NULL;
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS raw_content_archive BYTEA;
+    CREATE INDEX IF NOT EXISTS idx_rss_articles_canonical_id ON rss_articles (canonical_id);
+    CREATE TABLE IF NOT EXISTS article_fingerprints (
+        article_id INTEGER PRIMARY KEY REFERENCES rss_articles (id) ON DELETE CASCADE,
+        signature BYTEA NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS article_fingerprint_bands (
+        band_hash BIGINT NOT NULL,
+        article_id INTEGER NOT NULL REFERENCES article_fingerprints (article_id) ON DELETE CASCADE,
+        PRIMARY KEY (band_hash, article_id)
+    );
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('french', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('french', left(coalesce(raw_content, ''), 100000)), 'C')
+    ) STORED;
+    CREATE INDEX IF NOT EXISTS idx_rss_articles_search ON rss_articles USING GIN (search_vector);
+    ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS content_hash TEXT;
+    CREATE TABLE IF NOT EXISTS browser_domains (
+        domain TEXT PRIMARY KEY,
+        learned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Near-duplicate detection uses a MinHash signature of the article's word
+# shingles. The signature is cut into LSH bands; articles sharing any band hash
+# are candidates, confirmed by comparing full signatures. With 16 bands of 4
+# rows, pairs at 0.6 similarity are found ~90% of the time, pairs at 0.3 ~12%.
+MINHASH_SIZE = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_SIZE // LSH_BANDS
+EMPTY_BIN = 0xFFFFFFFF
+
+def minhash_signature(text: str) -> tuple:
+    """One-permutation MinHash over word shingles, or None when the text is too short to fingerprint."""
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < CONFIG['fingerprint_min_words']:
+        return None
+    size = CONFIG['shingle_size']
+    bins = [EMPTY_BIN] * MINHASH_SIZE
+    for i in range(len(words) - size + 1):
+        digest = hashlib.blake2b(' '.join(words[i:i + size]).encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, 'big')
+        slot = value % MINHASH_SIZE
+        value >>= 32
+        if value < bins[slot]:
+            bins[slot] = value
+    # Densify: an empty bin borrows the next filled bin so signatures stay comparable
+    for slot in range(MINHASH_SIZE):
+        offset = 1
+        while bins[slot] == EMPTY_BIN and offset < MINHASH_SIZE:
+            bins[slot] = bins[(slot + offset) % MINHASH_SIZE]
+            offset += 1
+    return tuple(bins)
+
+def signature_similarity(a: tuple, b: tuple) -> float:
+    return sum(x == y for x, y in zip(a, b)) / MINHASH_SIZE
+
+def lsh_band_hashes(signature: tuple) -> list:
+    hashes = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f'>I{LSH_ROWS}I', band, *rows), digest_size=8).digest()
+        hashes.append(int.from_bytes(digest, 'big', signed=True))
+    return hashes
+
+def content_hash(content: str) -> str:
+    # Same digest as content_hash in main.py, which keys cached summaries on it
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def pack_signature(signature: tuple) -> bytes:
+    return struct.pack(f'>{MINHASH_SIZE}I', *signature)
+
+def unpack_signature(data: bytes) -> tuple:
+    return struct.unpack(f'>{MINHASH_SIZE}I', data)
+
+def find_canonical(signature: tuple, candidates: list):
+    """Return the key of the most similar candidate (key, signature) above the near-duplicate threshold."""
+    best = None
+    best_similarity = CONFIG['near_duplicate_similarity']
+    for key, candidate in candidates:
+        similarity = signature_similarity(signature, candidate)
+        if similarity >= best_similarity:
+            best, best_similarity = key, similarity
+    return best
+
 class DatabaseManager:
     def __init__(self, db_url: str):
         self.db_url = db_url
+        self.pool = None
+        self.pending_articles = []
+        # Links of batches whose write failed; their feed entries must not be marked seen
+        self.failed_links = set()
+        self.stats = {'connections_opened': 0, 'statements_issued': 0, 'articles_written': 0, 'near_duplicates': 0}
 
-    async def init_db(self):
-        conn = await asyncpg.connect(self.db_url)
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS rss_articles (
-                id SERIAL PRIMARY KEY,
-                date TEXT,
-                title TEXT,
-                raw_content TEXT,
-                summary TEXT,
-                keyword TEXT,
-                link TEXT UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status TEXT DEFAULT 'out',
-                UNIQUE(link)
+    async def open_pool(self):
+        if self.pool is None:
+            self.pool = await asyncpg.create_pool(
+                self.db_url,
+                min_size=CONFIG['db_pool_min_size'],
+                max_size=CONFIG['db_pool_max_size'],
+                command_timeout=CONFIG['db_timeout'],
+                init=self._on_connect
             )
-        """)
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_link ON rss_articles(link)")
-        await conn.close()
 
-    async def article_exists(self, link: str) -> bool:
-        conn = await asyncpg.connect(self.db_url)
-        result = await conn.fetchval("SELECT 1 FROM rss_articles WHERE link = $1", link)
-        await conn.close()
-        return result is not None
+    async def close_pool(self):
+        try:
+            await self.flush_articles()
+        except Exception as e:
+            logger.error("Could not write the last batch of articles: %s", e)
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+        logger.info("Database stats: %d connections opened, %d statements issued, %d articles written, "
+                    "%d near-duplicates linked", self.stats['connections_opened'], self.stats['statements_issued'],
+                    self.stats['articles_written'], self.stats['near_duplicates'])
+
+    async def _on_connect(self, conn):
+        self.stats['connections_opened'] += 1
+
+    async def init_db(self):
+        await self.open_pool()
+        async with self.pool.acquire() as conn:
+            await conn.execute(SCHEMA_SQL)
+        self.stats['statements_issued'] += 1
+
+    async def sync_feeds(self, urls: list):
+        urls = list(dict.fromkeys(urls))
+        await self.open_pool()
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    INSERT INTO rss_feeds (url) SELECT unnest($1::text[])
+                    ON CONFLICT (url) DO UPDATE SET enabled = TRUE WHERE NOT rss_feeds.enabled
+                    """,
+                    urls
+                )
+                disabled = await conn.fetch(
+                    "UPDATE rss_feeds SET enabled = FALSE WHERE enabled AND url <> ALL($1::text[]) RETURNING url",
+                    urls
+                )
+        self.stats['statements_issued'] += 2
+        if disabled:
+            logger.info("Disabled %d feeds no longer configured: %s", len(disabled),
+                        ", ".join(row['url'] for row in disabled))
+
+    async def load_feeds(self) -> list:
+        await self.open_pool()
+        rows = await self.pool.fetch(
+            "SELECT url, etag, modified, seen_ids, poll_interval FROM rss_feeds WHERE enabled ORDER BY url"
+        )
+        self.stats['statements_issued'] += 1
+        return [
+            {
+                'url': row['url'],
+                'etag': row['etag'],
+                'modified': row['modified'],
+                'seen_ids': json.loads(row['seen_ids']) if row['seen_ids'] else [],
+                'poll_interval': row['poll_interval']
+            }
+            for row in rows
+        ]
+
+    async def save_feeds(self, feeds: list):
+        if not feeds:
+            return
+        await self.open_pool()
+        async with self.pool.acquire() as conn:
+            await conn.executemany("""
+                UPDATE rss_feeds
+                SET etag = $2, modified = $3, seen_ids = $4, last_polled_at = CURRENT_TIMESTAMP
+                WHERE url = $1
+            """, [(f['url'], f['etag'], f['modified'], json.dumps(f['seen_ids'])) for f in feeds])
+        self.stats['statements_issued'] += 1
+
+    async def load_browser_domains(self) -> set:
+        await self.open_pool()
+        rows = await self.pool.fetch("SELECT domain FROM browser_domains")
+        self.stats['statements_issued'] += 1
+        return {row['domain'] for row in rows}
+
+    async def save_browser_domains(self, domains: set):
+        if not domains:
+            return
+        await self.open_pool()
+        await self.pool.execute(
+            "INSERT INTO browser_domains (domain) SELECT unnest($1::text[]) ON CONFLICT (domain) DO NOTHING",
+            sorted(domains)
+        )
+        self.stats['statements_issued'] += 1
+
+    async def existing_links(self, links: list) -> set:
+        if not links:
+            return set()
+        await self.open_pool()
+        rows = await self.pool.fetch("SELECT link FROM rss_articles WHERE link = ANY($1::text[])", links)
+        self.stats['statements_issued'] += 1
+        return {row['link'] for row in rows}
+
+    async def queue_article(self, date: str, title: str, content: str, link: str, fingerprint: tuple = None,
+                            keyword: str = ''):
+        self.pending_articles.append({
+            'date': date, 'title': title, 'content': content, 'link': link, 'fingerprint': fingerprint,
+            'keyword': keyword
+        })
+        if len(self.pending_articles) >= CONFIG['insert_batch_size']:
+            await self.flush_articles()
+
+    async def _match_near_duplicates(self, conn, batch: list) -> dict:
+        """Map batch index -> ('db', article_id) or ('batch', index) of the article it duplicates."""
+        fingerprinted = [(i, item['fingerprint']) for i, item in enumerate(batch) if item['fingerprint'] is not None]
+        if not fingerprinted:
+            return {}
+
+        band_hashes = list({h for _, signature in fingerprinted for h in lsh_band_hashes(signature)})
+        rows = await conn.fetch("""
+            SELECT DISTINCT f.article_id, f.signature
+            FROM article_fingerprint_bands b JOIN article_fingerprints f ON f.article_id = b.article_id
+            WHERE b.band_hash = ANY($1::bigint[])
+        """, band_hashes)
+        self.stats['statements_issued'] += 1
+
+        candidates = [(('db', row['article_id']), unpack_signature(row['signature'])) for row in rows]
+        canonical_for = {}
+        for i, signature in fingerprinted:
+            canonical = find_canonical(signature, candidates)
+            if canonical is not None:
+                canonical_for[i] = canonical
+            else:
+                candidates.append((('batch', i), signature))
+        return canonical_for
+
+    async def flush_articles(self):
+        if not self.pending_articles:
+            return
+        batch, self.pending_articles = self.pending_articles, []
+        batch = list({item['link']: item for item in batch}.values())
+        await self.open_pool()
+
+        started = time.perf_counter()
+        try:
+            originals, duplicates = await self._write_batch(batch)
+        except Exception:
+            # The whole batch was rolled back: leave its entries unseen so the next run retries them
+            self.failed_links.update(item['link'] for item in batch)
+            metrics.inc("scraper_flush_failures_total")
+            raise
+
+        metrics.observe("scraper_stage_seconds", time.perf_counter() - started, stage="db_flush")
+        self.stats['articles_written'] += len(originals)
+        self.stats['near_duplicates'] += len(duplicates)
+        metrics.inc("scraper_articles_written_total", len(originals))
+        metrics.inc("scraper_near_duplicates_total", len(duplicates))
+        logger.info("Wrote batch of %d articles and %d near-duplicates", len(originals), len(duplicates))
+
+    async def _write_batch(self, batch: list) -> tuple:
+        """Insert one deduplicated batch in a single transaction; returns (originals, duplicates)."""
+        async with self.pool.acquire() as conn, conn.transaction():
+            canonical_for = await self._match_near_duplicates(conn, batch)
+            originals = [item for i, item in enumerate(batch) if i not in canonical_for]
+
+            # One unnest-based upsert for the whole batch, returning the new ids
+            rows = await conn.fetch("""
+                INSERT INTO rss_articles (date, title, raw_content, content_hash, summary, keyword, link, status)
+                SELECT date, title, raw_content, content_hash, '', keyword, link, 'out'
+                FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+                    AS t(date, title, raw_content, content_hash, keyword, link)
+                ON CONFLICT (link) DO UPDATE SET status = EXCLUDED.status, updated_at = CURRENT_TIMESTAMP
+                RETURNING id, link
+            """, [a['date'] for a in originals], [a['title'] for a in originals],
+                [a['content'] for a in originals], [content_hash(a['content']) for a in originals],
+                [a['keyword'] for a in originals], [a['link'] for a in originals])
+            ids_by_link = {row['link']: row['id'] for row in rows}
+            self.stats['statements_issued'] += 1
+
+            fingerprinted = [(ids_by_link[a['link']], a['fingerprint']) for a in originals if a['fingerprint'] is not None]
+            if fingerprinted:
+                await conn.executemany("""
+                    INSERT INTO article_fingerprints (article_id, signature) VALUES ($1, $2)
+                    ON CONFLICT (article_id) DO NOTHING
+                """, [(article_id, pack_signature(signature)) for article_id, signature in fingerprinted])
+                await conn.executemany("""
+                    INSERT INTO article_fingerprint_bands (band_hash, article_id) VALUES ($1, $2)
+                    ON CONFLICT DO NOTHING
+                """, [(h, article_id) for article_id, signature in fingerprinted for h in lsh_band_hashes(signature)])
+                self.stats['statements_issued'] += 2
+
+            # Near-duplicates keep their link (so they are not scraped again) but no
+            # content of their own, which also keeps them out of summarization
+            duplicates = []
+            for i, (source, key) in canonical_for.items():
+                canonical_id = key if source == 'db' else ids_by_link[batch[key]['link']]
+                item = batch[i]
+                duplicates.append((item['date'], item['title'], item['keyword'], item['link'], canonical_id))
+                logger.info("Near-duplicate of article %d: %s", canonical_id, item['link'])
+            if duplicates:
+                await conn.executemany("""
+                    INSERT INTO rss_articles (date, title, summary, keyword, link, status, canonical_id)
+                    VALUES ($1, $2, '', $3, $4, 'out', $5)
+                    ON CONFLICT (link) DO NOTHING
+                """, duplicates)
+                self.stats['statements_issued'] += 1
+        return originals, duplicates
+
+class RateLimiter:
+    """Spaces out calls to wait() so at most `rate` proceed per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        delay = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class ScrapeStats:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.pages = 0
+        # Percentiles cover the most recent fetches, so a daemon's memory stays flat
+        self.latencies = deque(maxlen=CONFIG['latency_window'])
+        self.tiers = Counter()
+        self.blocked = Counter()
+        self.bytes_loaded = 0
+        self.bytes_saved = 0
+
+    def record(self, seconds: float):
+        self.pages += 1
+        self.latencies.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.started
+        pages = self.pages
+        throughput = pages / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{pages} pages in {elapsed:.1f}s ({throughput:.2f} pages/s), "
+            f"fetch latency p50={self.percentile(0.5):.2f}s p95={self.percentile(0.95):.2f}s, "
+            f"tiers {dict(self.tiers)}, "
+            f"{sum(self.blocked.values())} requests blocked {dict(self.blocked)}, "
+            f"~{self.bytes_saved // 1024} KiB saved, {self.bytes_loaded // 1024} KiB loaded"
+        )
+
+    def snapshot(self) -> dict:
+        elapsed = time.monotonic() - self.started
+        pages = self.pages
+        return {
+            'pages': pages,
+            'pages_per_sec': round(pages / elapsed, 3) if elapsed > 0 else 0.0,
+            'fetch_p50_s': round(self.percentile(0.5), 3),
+            'fetch_p95_s': round(self.percentile(0.95), 3),
+            'tiers': dict(self.tiers)
+        }
 
 class ArticleScraper:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.playwright = None
         self.browser = None
         self.context = None
+        self.http_client = None
+        # Links whose scrape failed this run; their feed entries stay unseen so they are retried
+        self.failed_links = set()
+        # Browser navigations, used to decide when to recycle the context
+        self.browser_pages = 0
+        self.stats = ScrapeStats()
+        # Tier that served each URL being fetched ('http' or 'browser'), dropped once recorded
+        self.served_by = {}
+        # Domains whose pages only render with JavaScript; skip the HTTP tier for them.
+        # Learned ones are kept in browser_domains (see DatabaseManager.save_browser_domains)
+        self.browser_domains = set(CONFIG['browser_only_domains'])
+        self.learned_domains = set()
+
+    async def init_http_client(self):
+        self.http_client = httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT, **REQUEST_HEADERS},
+            timeout=CONFIG['http_timeout'],
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=CONFIG['http_max_connections'],
+                max_keepalive_connections=CONFIG['http_max_connections']
+            )
+        )
 
     async def init_browser(self):
         self.playwright = await async_playwright().start()
@@ -79,23 +656,54 @@ class ArticleScraper:
             ]
         )
 
-        self.context = await self.browser.new_context(
+        self.context = await self._new_context()
+
+    async def _new_context(self):
+        context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            user_agent=USER_AGENT,
             bypass_csp=True,
             java_script_enabled=True,
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            extra_http_headers=REQUEST_HEADERS
         )
+        if CONFIG['block_resources']:
+            await context.route("**/*", self._route_request)
+        context.on("response", self._on_response)
+        return context
+
+    @staticmethod
+    def _should_block(url: str, resource_type: str) -> bool:
+        host = urlparse(url).hostname or ""
+        if any(pattern in host for pattern in CONFIG['allowed_host_patterns']):
+            return False
+        if resource_type in CONFIG['blocked_resource_types']:
+            return True
+        return any(pattern in host for pattern in CONFIG['blocked_host_patterns'])
+
+    async def _route_request(self, route):
+        request = route.request
+        if self._should_block(request.url, request.resource_type):
+            self.stats.blocked[request.resource_type] += 1
+            self.stats.bytes_saved += TYPICAL_RESOURCE_BYTES.get(request.resource_type, 0)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_response(self, response):
+        length = response.headers.get('content-length')
+        if length and length.isdigit():
+            self.stats.bytes_loaded += int(length)
+
+    async def recycle_context(self):
+        # Pages still held by idle workers belong to the old context; they see
+        # is_closed() and open a fresh page from the new one
+        old_context = self.context
+        self.context = await self._new_context()
+        await old_context.close()
 
     async def close_browser(self):
+        if self.http_client:
+            await self.http_client.aclose()
         if self.context:
             await self.context.close()
         if self.browser:
@@ -103,99 +711,145 @@ class ArticleScraper:
         if self.playwright:
             await self.playwright.stop()
 
-    async def fetch_article_content(self, url: str) -> str:
-        page = await self.context.new_page()
-        content = ""
+    async def fetch_article_content(self, url: str, page=None) -> str:
+        started = time.monotonic()
+        domain = urlparse(url).netloc
 
         try:
-            response = await page.goto(
-                url,
-                timeout=CONFIG['page_load_timeout'],
-                wait_until='domcontentloaded'
-            )
+            http_content = ""
+            if domain not in self.browser_domains:
+                http_content = await self._fetch_via_http(url)
+                if not self._needs_browser(http_content):
+                    self._record_tier(url, 'http')
+                    return http_content.strip()
 
-            if response.status == 200:
-                content = await self._extract_content_with_fallbacks(page)
+            content = await self._fetch_via_browser(url, page)
+            tier = 'browser'
+            if not self._needs_browser(content):
+                # The browser got usable text where the plain GET did not; go straight there next time
+                if domain not in self.browser_domains:
+                    logger.info("Domain %s needs JavaScript, using browser from now on", domain)
+                    self.browser_domains.add(domain)
+                    self.learned_domains.add(domain)
+            elif len(http_content.strip()) > len(content):
+                # Neither tier passed; keep the longer text and leave the domain on HTTP
+                content, tier = http_content.strip(), 'http'
+            if content:
+                self._record_tier(url, tier)
+            return content
+
+        finally:
+            elapsed = time.monotonic() - started
+            self.stats.record(elapsed)
+            metrics.observe("scraper_fetch_seconds", elapsed, tier=self.served_by.pop(url, 'failed'))
 
-                if not content.strip():
-                    await page.wait_for_timeout(2000)
-                    content = await self._extract_content_with_fallbacks(page)
+    def _record_tier(self, url: str, tier: str):
+        self.served_by[url] = tier
+        self.stats.tiers[tier] += 1
 
-            if not content.strip() or "subscribe" in content.lower() or "cookie" in content.lower():
-                content = await self._handle_restricted_content(page)
+    @staticmethod
+    def _is_restricted(content: str) -> bool:
+        lowered = content.lower()
+        return not content.strip() or "subscribe" in lowered or "cookie" in lowered
+
+    def _needs_browser(self, content: str) -> bool:
+        return len(content.strip()) < CONFIG['min_content_length'] or self._is_restricted(content)
 
+    async def _fetch_via_http(self, url: str) -> str:
+        try:
+            with metrics.timer("scraper_stage_seconds", stage="http_get"):
+                response = await self.http_client.get(url)
+            if response.status_code != 200 or 'html' not in response.headers.get('content-type', ''):
+                return ""
+            with metrics.timer("scraper_stage_seconds", stage="http_extract"):
+                return await asyncio.to_thread(self._extract_html_content, response.text)
         except Exception as e:
-            logger.error(f"Error fetching article {url}: {str(e)}")
-            content = await self._fallback_content_extraction(page)
+            logger.debug("HTTP fetch failed for %s: %s", url, e)
+            return ""
 
-        finally:
-            await page.close()
+    @staticmethod
+    def _extract_html_content(html: str) -> str:
+        soup = BeautifulSoup(html, 'html.parser')
+        for element in soup.select('script, style, noscript'):
+            element.decompose()
+        for element in soup.find_all(BLOCK_TAGS):
+            element.insert_before('\n')
+            element.insert_after('\n')
 
-        return content.strip()
+        for selector in CONTENT_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                lines = (' '.join(line.split()) for line in element.get_text(' ').splitlines())
+                content = '\n'.join(line for line in lines if line)
+                if content:
+                    return content
 
-    async def _extract_content_with_fallbacks(self, page) -> str:
-        content = ""
-        selectors = [
-            'article',
-            'main',
-            '.article-content',
-            '.content',
-            '#article-content',
-            '.article-body',
-            '.post-content'
-        ]
+        for element in soup.select(BOILERPLATE_SELECTORS):
+            element.decompose()
+        return '\n'.join(p.get_text(' ', strip=True) for p in soup.find_all('p'))
 
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.text_content()
-                    if content.strip():
-                        break
-            except:
-                continue
+    async def _fetch_via_browser(self, url: str, page=None) -> str:
+        owns_page = page is None
+        if owns_page:
+            page = await self.context.new_page()
+        content = ""
+        self.browser_pages += 1
 
-        if not content.strip():
-            content = await page.evaluate('''() => {
-                const elementsToRemove = document.querySelectorAll(
-                    'header, footer, nav, aside, .ads, .advertisement, .social-share'
-                );
-                elementsToRemove.forEach(el => el.remove());
+        try:
+            with metrics.timer("scraper_stage_seconds", stage="browser_goto"):
+                response = await page.goto(
+                    url,
+                    timeout=CONFIG['page_load_timeout'],
+                    wait_until='domcontentloaded'
+                )
 
-                const article = document.querySelector('article');
-                if (article) return article.innerText;
+            if response.status == 200:
+                with metrics.timer("scraper_stage_seconds", stage="browser_extract"):
+                    extracted = await self._extract_in_page(page)
+                content = extracted['text']
 
-                const main = document.querySelector('main');
-                if (main) return main.innerText;
+                # Text rendered late by JavaScript, or hidden until the consent
+                # banner just dismissed goes away: wait for it, then extract again
+                if len(content.strip()) < CONFIG['min_content_length'] or self._is_restricted(content):
+                    with metrics.timer("scraper_stage_seconds", stage="content_wait"):
+                        appeared = await self._wait_for_content(page)
+                    if appeared:
+                        with metrics.timer("scraper_stage_seconds", stage="browser_extract"):
+                            extracted = await self._extract_in_page(page)
+                        content = extracted['text']
 
-                const paragraphs = Array.from(document.getElementsByTagName('p'));
-                return paragraphs.map(p => p.innerText).join('\n');
-            }''')
+                logger.debug("Extracted %d chars from %s (score %s, %s candidates, consent dismissed: %s)",
+                             len(content), url, extracted['score'], extracted['candidates'], extracted['dismissed'])
 
-        return content
+        except Exception as e:
+            logger.error("Error fetching article %s: %s", url, e)
+            content = await self._fallback_content_extraction(page)
 
-    async def _handle_restricted_content(self, page) -> str:
-        try:
-            cookie_buttons = [
-                'button:has-text("Accept")',
-                'button:has-text("Accepter")',
-                'button:has-text("I agree")',
-                '.cookie-button',
-                '#cookie-accept'
-            ]
+        finally:
+            if owns_page:
+                await page.close()
 
-            for button in cookie_buttons:
-                try:
-                    await page.click(button, timeout=2000)
-                    await page.wait_for_timeout(1000)
-                except:
-                    continue
+        return content.strip()
 
-            return await self._extract_content_with_fallbacks(page)
+    @staticmethod
+    async def _extract_in_page(page) -> dict:
+        return await page.evaluate(EXTRACTION_SCRIPT, {
+            'boilerplate': BOILERPLATE_SELECTORS,
+            'consentSelectors': CONSENT_SELECTORS,
+            'consentPattern': CONSENT_TEXT_PATTERN
+        })
 
-        except Exception as e:
-            logger.error(f"Error handling restricted content: {str(e)}")
-            return ""
+    @staticmethod
+    async def _wait_for_content(page) -> bool:
+        try:
+            await page.wait_for_function(
+                CONTENT_READY_SCRIPT,
+                arg=CONFIG['min_content_length'],
+                timeout=CONFIG['content_wait_timeout']
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
     async def _fallback_content_extraction(self, page) -> str:
         try:
@@ -217,7 +871,7 @@ class ArticleScraper:
             real_url = parse_qs(parsed_url.query).get('url', [None])[0]
             return real_url if real_url else google_url
         except Exception as e:
-            logger.error(f"Error extracting real link: {e}")
+            logger.error("Error extracting real link: %s", e)
             return google_url
 
     @staticmethod
@@ -229,66 +883,398 @@ class ArticleScraper:
                 continue
         return datetime.now().strftime("%Y-%m-%d")
 
-async def process_feed(feed_url: str, scraper: ArticleScraper, db_manager: DatabaseManager):
-    feed = feedparser.parse(feed_url)
-    tasks = []
+def configured_feeds() -> list:
+    feeds_file = os.getenv('RSS_FEEDS_FILE')
+    if feeds_file:
+        with open(feeds_file) as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    if os.getenv('RSS_FEEDS'):
+        return [url for url in re.split(r'[\s,]+', os.getenv('RSS_FEEDS')) if url]
+    return RSS_FEEDS
+
+def entry_id(entry) -> str:
+    return entry.get('id') or entry.get('link')
+
+ALERT_TITLE = re.compile(r'^\s*(?:Google Alert|Alerte Google)\s*[-\u2013\u2014:]\s*', re.IGNORECASE)
 
-    for entry in feed.entries:
-        link = scraper.extract_real_link(entry.link)
-        if not await db_manager.article_exists(link):
-            tasks.append(process_entry(scraper, entry, db_manager))
+def feed_keyword(parsed) -> str:
+    """Search term of a Google Alerts feed, from its title ("Google Alert - restaurant"), or the feed title."""
+    title = parsed.feed.get('title', '')
+    return ALERT_TITLE.sub('', title).strip().strip('"\u201c\u201d').strip()
 
-    chunk_size = CONFIG['max_concurrent_scrapes']
-    for i in range(0, len(tasks), chunk_size):
-        chunk = tasks[i:i + chunk_size]
-        await asyncio.gather(*chunk)
-        await asyncio.sleep(1)
+async def poll_feed(feed: dict, scraper: ArticleScraper) -> list:
+    """Fetch one feed with a conditional GET and return its entries not seen on earlier polls.
 
-async def process_entry(scraper: ArticleScraper, entry, db_manager: DatabaseManager):
+    Updates the feed's etag/modified/window in place; seen_ids is settled after scraping.
+    """
+    headers = {}
+    if feed['etag']:
+        headers['If-None-Match'] = feed['etag']
+    if feed['modified']:
+        headers['If-Modified-Since'] = feed['modified']
+
+    try:
+        with metrics.timer("scraper_stage_seconds", stage="feed_fetch"):
+            response = await scraper.http_client.get(feed['url'], headers=headers)
+        if response.status_code == 304:
+            logger.info("Feed unchanged: %s", feed['url'])
+            metrics.inc("scraper_feeds_total", result="unchanged")
+            feed['window'] = None
+            return []
+        response.raise_for_status()
+        with metrics.timer("scraper_stage_seconds", stage="feed_parse"):
+            parsed = await asyncio.to_thread(feedparser.parse, response.content)
+    except Exception as e:
+        logger.error("Error fetching feed %s: %s", feed['url'], e)
+        metrics.inc("scraper_feeds_total", result="error")
+        feed['window'] = None
+        return []
+
+    feed['etag'] = response.headers.get('etag')
+    feed['modified'] = response.headers.get('last-modified')
+    seen = set(feed['seen_ids'])
+    keyword = feed_keyword(parsed)
+    for entry in parsed.entries:
+        entry['alert_keyword'] = keyword
+    entries = [(ArticleScraper.extract_real_link(entry.link), entry) for entry in parsed.entries]
+    feed['window'] = entries
+    new_entries = [(link, entry) for link, entry in entries if entry_id(entry) not in seen]
+    metrics.inc("scraper_feeds_total", result="fetched")
+    logger.info("Feed %s: %d entries, %d new", feed['url'], len(parsed.entries), len(new_entries))
+    return new_entries
+
+def settle_feed_state(feed: dict, failed_links: set):
+    # Remember the current feed window, minus entries whose scrape failed so
+    # the next poll offers them again
+    window = feed.pop('window', None)
+    if window is None:
+        return
+    seen = [entry_id(entry) for link, entry in window if link not in failed_links]
+    feed['seen_ids'] = seen[:CONFIG['max_seen_ids_per_feed']]
+    if len(seen) < len(window):
+        # A 304 would hide the failed entries, so refetch the full feed next time
+        feed['etag'] = None
+        feed['modified'] = None
+
+async def dedup_entries(entries: list, db_manager: DatabaseManager) -> list:
+    # Keep the first occurrence of each link across all feeds, then drop
+    # links already stored with a single set-based lookup.
+    unique = {}
+    for link, entry in entries:
+        unique.setdefault(link, entry)
+
+    with metrics.timer("scraper_stage_seconds", stage="existing_links"):
+        existing = await db_manager.existing_links(list(unique))
+    new_entries = [(link, entry) for link, entry in unique.items() if link not in existing]
+    logger.info("Dedup: %d entries, %d unique links, %d already stored, %d to scrape",
+                len(entries), len(unique), len(existing), len(new_entries))
+    return new_entries
+
+async def scrape_worker(queue: asyncio.Queue, scraper: ArticleScraper, db_manager: DatabaseManager,
+                        rate_limiter: RateLimiter, domain_limits: dict):
+    # Each worker keeps one page open and reuses it for every entry it pulls.
+    page = await scraper.context.new_page()
+    try:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    break
+                link, entry = item
+                async with domain_limits[urlparse(link).netloc]:
+                    await rate_limiter.wait()
+                    if page.is_closed():
+                        page = await scraper.context.new_page()
+                    await process_entry(scraper, entry, link, db_manager, page)
+            finally:
+                queue.task_done()
+    finally:
+        if not page.is_closed():
+            await page.close()
+
+def start_workers(queue: asyncio.Queue, scraper: ArticleScraper, db_manager: DatabaseManager, count: int) -> list:
+    rate_limiter = RateLimiter(CONFIG['max_requests_per_second'])
+    domain_limits = defaultdict(lambda: asyncio.Semaphore(CONFIG['max_scrapes_per_domain']))
+    return [
+        asyncio.create_task(scrape_worker(queue, scraper, db_manager, rate_limiter, domain_limits))
+        for _ in range(count)
+    ]
+
+async def scrape_entries(entries: list, scraper: ArticleScraper, db_manager: DatabaseManager):
+    if not entries:
+        return
+
+    queue = asyncio.Queue()
+    for item in entries:
+        queue.put_nowait(item)
+
+    worker_count = min(CONFIG['max_concurrent_scrapes'], len(entries))
+    for _ in range(worker_count):
+        queue.put_nowait(None)
+
+    await asyncio.gather(*start_workers(queue, scraper, db_manager, worker_count))
+    logger.info("Scrape throughput: %s", scraper.stats.report())
+
+async def process_entry(scraper: ArticleScraper, entry, link: str, db_manager: DatabaseManager, page=None):
     try:
         title = entry.title
         date = scraper.convert_date(entry.get('published', datetime.now().isoformat()))
-        link = scraper.extract_real_link(entry.link)
 
-        content = await scraper.fetch_article_content(link)
+        content = await scraper.fetch_article_content(link, page)
         if not content:
-            logger.warning(f"No content retrieved for {link}")
+            logger.warning("No content retrieved for %s", link)
+            metrics.inc("scraper_entries_total", result="empty")
+            scraper.failed_links.add(link)
             return
 
-        conn = await asyncpg.connect(db_manager.db_url)
-        await conn.execute("""
-            INSERT INTO rss_articles (date, title, raw_content, summary, keyword, link, status)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (link) DO UPDATE SET status = EXCLUDED.status
-        """, date, title, content, "", "", link, "out")
-        await conn.close()
+        with metrics.timer("scraper_stage_seconds", stage="fingerprint"):
+            fingerprint = await asyncio.to_thread(minhash_signature, content)
+        with metrics.timer("scraper_stage_seconds", stage="queue_article"):
+            await db_manager.queue_article(date, title, content, link, fingerprint, entry.get('alert_keyword', ''))
 
-        logger.info(f"Successfully processed: {title}")
+        metrics.inc("scraper_entries_total", result="stored")
+        logger.info("Successfully processed: %s", title)
 
     except Exception as e:
-        logger.error(f"Error processing entry: {str(e)}")
+        logger.error("Error processing entry %s: %s", link, e)
+        metrics.inc("scraper_entries_total", result="error")
+        scraper.failed_links.add(link)
 
 async def process_feeds(db_manager: DatabaseManager):
+    await db_manager.open_pool()
     scraper = ArticleScraper(db_manager)
-    await scraper.init_browser()
+    await scraper.init_http_client()
+    scraper.browser_domains |= await db_manager.load_browser_domains()
 
     try:
-        for feed_url in RSS_FEEDS:
-            logger.info(f"Processing feed: {feed_url}")
-            await process_feed(feed_url, scraper, db_manager)
+        await db_manager.sync_feeds(configured_feeds())
+        feeds = await db_manager.load_feeds()
+        logger.info("Polling %d feeds", len(feeds))
+        polled = await asyncio.gather(*[poll_feed(feed, scraper) for feed in feeds])
+        entries = [item for feed_entries in polled for item in feed_entries]
+
+        new_entries = await dedup_entries(entries, db_manager)
+        if new_entries:
+            # Only pay for Chromium when there is something to scrape
+            await scraper.init_browser()
+            await scrape_entries(new_entries, scraper, db_manager)
+        # Write the last batch before marking anything seen; if this fails the
+        # feed state is not saved and the next run offers the entries again
+        await db_manager.flush_articles()
+
+        for feed in feeds:
+            settle_feed_state(feed, scraper.failed_links | db_manager.failed_links)
+        await db_manager.save_feeds(feeds)
+        await db_manager.save_browser_domains(scraper.learned_domains)
 
     except (KeyboardInterrupt, asyncio.CancelledError):
         logger.warning("Operation cancelled. Cleaning up...")
 
     finally:
         await scraper.close_browser()
+        await db_manager.close_pool()
+        write_run_summary()
         logger.info("Scraping completed.")
 
+def write_run_summary():
+    """Log per-stage timings and counters for this run, and save them to metrics_file if set."""
+    logger.info("Run summary:\n%s", metrics.summary())
+    if CONFIG['metrics_file']:
+        try:
+            with open(CONFIG['metrics_file'], 'w') as f:
+                json.dump(metrics.snapshot(), f, indent=2)
+        except OSError as e:
+            logger.error("Could not write metrics file: %s", e)
+
+def process_tree_rss_mb() -> float:
+    """Resident memory of this process and its descendants (the Chromium processes), read from /proc."""
+    children = defaultdict(list)
+    rss_pages = {}
+    try:
+        pids = [int(pid) for pid in os.listdir('/proc') if pid.isdigit()]
+    except OSError:
+        return 0.0
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            children[int(fields[1])].append(pid)
+            rss_pages[pid] = int(fields[21])
+        except (OSError, ValueError, IndexError):
+            continue
+
+    total = 0
+    stack = [os.getpid()]
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+class ScraperDaemon:
+    """Long-running scraper that keeps the browser, HTTP client and DB pool warm
+    and polls each feed on its own interval."""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.scraper = ArticleScraper(db_manager)
+        self.queue = asyncio.Queue()
+        self.stopping = asyncio.Event()
+        self.workers = []
+        self.next_poll = {}
+        self.pages_at_recycle = 0
+        self.context_recycles = 0
+        self.last_run = None
+        self.consecutive_failures = 0
+
+    async def start(self):
+        await self.db_manager.init_db()
+        await self.db_manager.sync_feeds(configured_feeds())
+        await self.scraper.init_http_client()
+        self.scraper.browser_domains |= await self.db_manager.load_browser_domains()
+        await self.scraper.init_browser()
+        self.workers = start_workers(self.queue, self.scraper, self.db_manager, CONFIG['max_concurrent_scrapes'])
+
+    def stop(self):
+        if self.stopping.is_set():
+            return
+        logger.warning("Stop requested, draining in-flight pages...")
+        self.stopping.set()
+        # Drop entries not started yet; they stay unseen and are picked up by the next run
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is not None:
+                self.scraper.failed_links.add(item[0])
+            self.queue.task_done()
+
+    def _poll_interval(self, feed: dict) -> float:
+        interval = feed['poll_interval'] or CONFIG['feed_poll_interval']
+        jitter = CONFIG['feed_poll_jitter']
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def run_cycle(self):
+        feeds = await self.db_manager.load_feeds()
+        now = time.monotonic()
+        due = [feed for feed in feeds if self.next_poll.get(feed['url'], 0) <= now]
+        if not due:
+            return
+
+        started = time.monotonic()
+        self.scraper.failed_links.clear()
+        self.db_manager.failed_links.clear()
+        polled = await asyncio.gather(*[poll_feed(feed, self.scraper) for feed in due])
+        entries = [item for feed_entries in polled for item in feed_entries]
+        new_entries = await dedup_entries(entries, self.db_manager)
+        for item in new_entries:
+            if self.stopping.is_set():
+                self.scraper.failed_links.add(item[0])
+            else:
+                self.queue.put_nowait(item)
+        await self.queue.join()
+        await self.db_manager.flush_articles()
+
+        for feed in due:
+            settle_feed_state(feed, self.scraper.failed_links | self.db_manager.failed_links)
+            self.next_poll[feed['url']] = time.monotonic() + self._poll_interval(feed)
+        await self.db_manager.save_feeds(due)
+        await self.db_manager.save_browser_domains(self.scraper.learned_domains)
+        self.scraper.learned_domains.clear()
+
+        self.last_run = {
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'duration_s': round(time.monotonic() - started, 1),
+            'feeds_polled': len(due),
+            'new_entries': len(new_entries)
+        }
+        logger.info("Cycle done: %s", self.last_run)
+        await self.maybe_recycle_context()
+
+    async def maybe_recycle_context(self):
+        # Runs between cycles, when no page is in flight
+        pages = self.scraper.browser_pages - self.pages_at_recycle
+        rss_mb = process_tree_rss_mb()
+        if pages < CONFIG['context_max_pages'] and rss_mb < CONFIG['browser_max_rss_mb']:
+            return
+        logger.info("Recycling browser context after %d pages (%.0f MB resident)", pages, rss_mb)
+        await self.scraper.recycle_context()
+        self.pages_at_recycle = self.scraper.browser_pages
+        self.context_recycles += 1
+
+    def write_health(self, status: str):
+        health = {
+            'status': status,
+            'queue_depth': self.queue.qsize(),
+            'last_run': self.last_run,
+            'consecutive_failures': self.consecutive_failures,
+            'context_recycles': self.context_recycles,
+            'rss_mb': round(process_tree_rss_mb(), 1),
+            'db': dict(self.db_manager.stats),
+            **self.scraper.stats.snapshot()
+        }
+        try:
+            with open(CONFIG['health_file'], 'w') as f:
+                json.dump(health, f, indent=2)
+        except OSError as e:
+            logger.error("Could not write health file: %s", e)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
+
+        await self.start()
+        try:
+            while not self.stopping.is_set():
+                try:
+                    await self.run_cycle()
+                    self.consecutive_failures = 0
+                    self.write_health('running')
+                    now = time.monotonic()
+                    wait = min(self.next_poll.values(), default=now) - now
+                except Exception as e:
+                    # A DB blip or pool timeout should not end the daemon; feeds whose
+                    # state was not saved are simply polled again after the backoff
+                    self.consecutive_failures += 1
+                    wait = min(CONFIG['daemon_error_backoff'] * 2 ** (self.consecutive_failures - 1),
+                               CONFIG['daemon_max_error_backoff'])
+                    logger.exception("Cycle failed (%d in a row), retrying in %.0fs: %s",
+                                     self.consecutive_failures, wait, e)
+                    metrics.inc("scraper_cycle_failures_total")
+                    self.write_health('degraded')
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), timeout=max(1.0, wait))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.stop()
+            await self.queue.join()
+            for _ in self.workers:
+                self.queue.put_nowait(None)
+            await asyncio.gather(*self.workers, return_exceptions=True)
+            await self.scraper.close_browser()
+            await self.db_manager.close_pool()
+            self.write_health('stopped')
+            write_run_summary()
+            logger.info("Scraper daemon stopped.")
+
+async def run(db_manager: DatabaseManager):
+    await db_manager.init_db()
+    await process_feeds(db_manager)
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Scrape Google Alerts feeds into rss_articles.")
+    parser.add_argument('--daemon', action='store_true', help="keep running and poll each feed on its interval")
+    args = parser.parse_args()
+
     db_url = os.getenv('DATABASE_URL')
     if not db_url:
         raise ValueError("DATABASE_URL environment variable not set")
 
     db_manager = DatabaseManager(db_url)
-    asyncio.run(db_manager.init_db())
-    asyncio.run(process_feeds(db_manager))
+    if args.daemon:
+        asyncio.run(ScraperDaemon(db_manager).run())
+    else:
+        asyncio.run(run(db_manager))
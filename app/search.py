@@ -0,0 +1,118 @@
+"""Full-text search over article titles, summaries and text.
+
+On Postgres every row carries a weighted tsvector in the generated
+search_vector column (title A, summary B, text C), indexed with GIN. SQLite
+uses the rss_articles_fts FTS5 table, kept in sync with rss_articles by
+triggers. Both are created by migration 0007_article_search (and SCHEMA_SQL in
+scraper.py for Postgres) and are deliberately absent from the models.
+
+Archived articles (see app/archive.py) remain searchable by title and summary.
+"""
+import os
+import re
+
+import sqlalchemy
+
+from . import db
+from .models import Article
+
+SEARCH_LANGUAGE = "french"
+SEARCH_DIALECTS = ("postgresql", "sqlite")
+# Matches ranked per query, newest first; ranking every match of a word found
+# in most articles would cost tens of milliseconds per 10k articles
+RANK_CANDIDATES = int(os.getenv("SEARCH_RANK_CANDIDATES", "500"))
+FTS_TABLE = "rss_articles_fts"
+# bm25 weights of the FTS5 title, summary and raw_content columns, in line
+# with ts_rank's default 1.0 / 0.4 / 0.2 for weights A / B / C
+FTS_WEIGHTS = (1.0, 0.4, 0.2)
+# ts_rank normalization: divide by 1 + log(document length) so long
+# articles do not outrank short ones just by repeating a word
+RANK_NORMALIZATION = 1
+
+QUERY_TOKENS = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+def fts5_query(text: str) -> str:
+    """Translate web-search syntax ("a phrase", or, -word) to an FTS5 MATCH expression.
+
+    Every term is quoted (stray quotes dropped), so FTS5 operators and
+    punctuation in user input are matched as plain text.
+    """
+    included, excluded = [], []
+    pending_or = False
+    for negated, phrase, word in QUERY_TOKENS.findall(text):
+        if word and word.lower() == "or":
+            pending_or = bool(included)
+            continue
+        if word.startswith("-") and len(word) > 1:
+            negated, word = "-", word[1:]
+        term = (phrase or word).replace('"', '').strip()
+        if not term:
+            continue
+        term = f'"{term}"'
+        if negated:
+            excluded.append(term)
+        elif pending_or:
+            included[-1] = f"{included[-1]} OR {term}"
+        else:
+            included.append(term)
+        pending_or = False
+    if not included:
+        return ""
+    expression = " AND ".join(f"({term})" for term in included)
+    return expression + "".join(f" NOT {term}" for term in excluded)
+
+def search_articles(text, columns, filters, limit, offset, candidates=RANK_CANDIDATES):
+    """Rows of the given columns plus a rank (higher is better), best matches first.
+
+    Only the newest `candidates` matches are ranked, so a word found in most
+    articles costs no more than a selective one; with candidates=None every
+    match is ranked. Returns (rows, truncated), truncated telling whether
+    older matches were left out.
+    """
+    dialect = db.engine.dialect.name
+    if dialect == "postgresql":
+        search_vector = sqlalchemy.literal_column("rss_articles.search_vector")
+        query = sqlalchemy.func.websearch_to_tsquery(
+            sqlalchemy.literal_column(f"'{SEARCH_LANGUAGE}'::regconfig"), text
+        )
+        matches = db.session.query(Article.id).filter(search_vector.op("@@")(query), *filters)
+        ranked = matches
+        if candidates is not None:
+            ranked = ranked.order_by(Article.id.desc()).limit(candidates)
+        ranked = ranked.subquery()
+        # ts_rank rather than ts_rank_cd: cover density costs about twice as
+        # much per row for little gain here
+        rank = sqlalchemy.func.ts_rank(search_vector, query, RANK_NORMALIZATION)
+    elif dialect == "sqlite":
+        match = fts5_query(text)
+        if not match:
+            return [], False
+        fts = sqlalchemy.table(FTS_TABLE, sqlalchemy.column("rowid"))
+        matches = (
+            db.session.query(Article.id.label("id"))
+            .select_from(fts)
+            .join(Article, Article.id == fts.c.rowid)
+            .filter(sqlalchemy.literal_column(FTS_TABLE).op("MATCH")(match), *filters)
+        )
+        # bm25() only works next to the MATCH, so it is computed in the
+        # subquery; it is negative, lower meaning more relevant
+        bm25 = sqlalchemy.func.bm25(sqlalchemy.literal_column(FTS_TABLE), *FTS_WEIGHTS)
+        ranked = matches.add_columns((-bm25).label("rank"))
+        if candidates is not None:
+            ranked = ranked.order_by(fts.c.rowid.desc()).limit(candidates)
+        ranked = ranked.subquery()
+        rank = ranked.c.rank
+    else:
+        raise NotImplementedError(f"Full-text search is not available on {dialect}")
+
+    rows = (
+        db.session.query(*columns, rank.label("rank"))
+        .join(ranked, ranked.c.id == Article.id)
+        .order_by(rank.desc(), Article.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    # Unordered and bounded, so this stops after candidates + 1 index hits
+    truncated = candidates is not None and matches.limit(candidates + 1).count() > candidates
+    return rows, truncated
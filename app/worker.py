@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import timedelta
+
+import sqlalchemy
+from sqlalchemy.orm import undefer_group
+
+from . import create_app, db
+from .models import Article
+from .main import content_hash, generate_summary, summary_cache_key, SUMMARY_FALLBACK_PREFIX
+from .mistral import close_mistral_client
+from .metrics import metrics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WORKER_CONFIG = {
+    'concurrency': int(os.getenv("SUMMARY_WORKER_CONCURRENCY", "4")),
+    'batch_size': int(os.getenv("SUMMARY_WORKER_BATCH_SIZE", "20")),
+    'poll_interval': float(os.getenv("SUMMARY_WORKER_POLL_INTERVAL", "5")),
+    # A running job whose row was not touched for this long belongs to a worker
+    # that died (e.g. killed on deploy) and is claimed again; live workers
+    # renew their jobs well before that
+    'lease_timeout': float(os.getenv("SUMMARY_WORKER_LEASE_TIMEOUT", "600"))
+}
+
+def claim_batch(batch_size):
+    # SKIP LOCKED lets several workers drain the queue without claiming the same rows;
+    # SQLite ignores the locking clause, which is fine for a single local worker.
+    # The cutoff uses the database clock, which also stamps updated_at.
+    expired = db.session.scalar(sqlalchemy.select(sqlalchemy.func.now())) - timedelta(
+        seconds=WORKER_CONFIG['lease_timeout']
+    )
+    articles = (
+        Article.query
+        .filter(sqlalchemy.or_(
+            Article.summary_status == "pending",
+            sqlalchemy.and_(Article.summary_status == "running", Article.updated_at < expired)
+        ))
+        .options(undefer_group("content"))
+        .order_by(Article.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for article in articles:
+        if article.summary_status == "running":
+            logger.warning("Reclaiming article %d from a worker that stopped", article.id)
+            metrics.inc("worker_reclaimed_total")
+        article.summary_status = "running"
+        article.updated_at = db.func.now()
+    db.session.commit()
+    return articles
+
+def renew_lease(article_ids):
+    Article.query.filter(Article.id.in_(article_ids), Article.summary_status == "running").update(
+        {"updated_at": db.func.now()}, synchronize_session=False
+    )
+    db.session.commit()
+
+async def summarize_batch(articles, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    # Read everything up front: each commit below expires the loaded articles
+    contents = {article.id: article.content for article in articles}
+
+    async def summarize(article_id):
+        async with semaphore:
+            return article_id, await generate_summary(contents[article_id])
+
+    # Store each summary as soon as it is ready so streaming /results clients
+    # see it without waiting for the slowest article in the batch
+    remaining = set(contents)
+    renewed = time.monotonic()
+    for next_done in asyncio.as_completed([summarize(article_id) for article_id in contents]):
+        article_id, summary = await next_done
+        remaining.discard(article_id)
+        summary = summary if summary and summary.strip() else "No summary available"
+        if summary.startswith(SUMMARY_FALLBACK_PREFIX):
+            values = {"summary": summary, "summary_status": "failed"}
+        else:
+            article_hash = content_hash(contents[article_id])
+            values = {"summary": summary, "content_hash": article_hash, "summary_key": summary_cache_key(article_hash),
+                      "summary_status": "done"}
+        with metrics.timer("worker_stage_seconds", stage="store"):
+            db.session.execute(sqlalchemy.update(Article).where(Article.id == article_id).values(**values))
+            db.session.commit()
+        metrics.inc("worker_summaries_total", status=values['summary_status'])
+        logger.info("Summarized article %d (%s)", article_id, values['summary_status'])
+        if remaining and time.monotonic() - renewed > WORKER_CONFIG['lease_timeout'] / 3:
+            renew_lease(remaining)
+            renewed = time.monotonic()
+
+async def drain_queue(watch=False):
+    try:
+        while True:
+            with metrics.timer("worker_stage_seconds", stage="claim"):
+                articles = claim_batch(WORKER_CONFIG['batch_size'])
+            if articles:
+                started = time.monotonic()
+                await summarize_batch(articles, WORKER_CONFIG['concurrency'])
+                logger.info("Summarized %d articles in %.1fs", len(articles), time.monotonic() - started)
+                continue
+            if not watch:
+                break
+            await asyncio.sleep(WORKER_CONFIG['poll_interval'])
+    finally:
+        await close_mistral_client()
+        logger.info("Worker run summary:\n%s", metrics.summary())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drain the article summarization queue.")
+    parser.add_argument("--watch", action="store_true", help="keep polling for new jobs instead of exiting when the queue is empty")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        asyncio.run(drain_queue(watch=args.watch))
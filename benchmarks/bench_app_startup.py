@@ -0,0 +1,56 @@
+"""App startup time and per-request overhead of the WSGI entry point.
+
+Compares building the app on every request (the previous behaviour, including
+db.create_all) with the cached per-worker app behind app.application.
+
+    python benchmarks/bench_app_startup.py
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MISTRAL_API_KEY", "benchmark")
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+from werkzeug.test import EnvironBuilder
+
+import app as app_module
+from app import create_app, db
+
+REQUESTS = 200
+PATH = "/api/summary-cache"
+
+def call(wsgi_app):
+    environ = EnvironBuilder(path=PATH).get_environ()
+    body = wsgi_app(environ, lambda status, headers, exc_info=None: None)
+    b"".join(body)
+
+def rebuild_per_request(environ, start_response):
+    fresh = create_app()
+    with fresh.app_context():
+        db.create_all()
+    return fresh(environ, start_response)
+
+def measure(wsgi_app):
+    timings = []
+    for _ in range(REQUESTS):
+        started = time.perf_counter()
+        call(wsgi_app)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), sorted(timings)[int(len(timings) * 0.95)]
+
+def main():
+    started = time.perf_counter()
+    create_app()
+    print(f"create_app: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    for label, wsgi_app in [("rebuild per request", rebuild_per_request), ("cached per worker", app_module.application)]:
+        p50, p95 = measure(wsgi_app)
+        print(f"{label:>20}: p50 {p50:.2f} ms, p95 {p95:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Storage and payload sizes before and after compression.
+
+Seeds summarized articles with realistic-length French text, then reports:
+
+- raw_content storage before and after archive_contents() (and the table's
+  on-disk size on Postgres), plus the cost of decompressing on re-summarize;
+- /api/articles and /api/results body sizes and server time for identity,
+  gzip and (when the brotli module is installed) br.
+
+Runs against DATABASE_URL when set (use a scratch database, the table is
+rebuilt), otherwise a temporary SQLite file.
+
+    python benchmarks/bench_compression.py
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MISTRAL_API_KEY", "benchmark")
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+import sqlalchemy
+from sqlalchemy.orm import undefer_group
+
+from app import create_app, db
+from app.archive import archive_contents, content_storage
+from app.main import brotli, content_hash, summary_cache_key
+from app.models import Article
+
+ARTICLE_COUNT = 2000
+SELECTED = 200
+ROUNDS = 20
+WORDS = ("le la les un une des du de et à en pour avec sur dans par conseil municipal projet restaurant ville "
+         "quartier habitants maire travaux ouverture chef cuisine terrasse saison budget commerce rue place "
+         "marché étoilé menu produits locaux gastronomie établissement clientèle réservation service").split()
+
+def paragraph(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 90))).capitalize() + "."
+
+def seed(rng):
+    db.drop_all()
+    db.create_all()
+    rows = []
+    for i in range(ARTICLE_COUNT):
+        content = "\n".join(paragraph(rng) for _ in range(rng.randint(6, 20)))
+        rows.append({
+            "title": f"Article {i}", "raw_content": content, "link": f"https://example.com/{i}",
+            "summary": paragraph(rng), "content_hash": content_hash(content),
+            "summary_key": summary_cache_key(content_hash(content)), "summary_status": "done",
+            "keyword": "restaurant", "status": "in" if i < SELECTED else "out"
+        })
+    db.session.bulk_insert_mappings(Article, rows)
+    db.session.commit()
+
+def print_storage(label, storage):
+    print(f"{label:>8}: " + ", ".join(f"{key} {value:,}" for key, value in storage.items()))
+
+def measure_payload(client, path, encoding):
+    headers = {"Accept-Encoding": encoding} if encoding else {}
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+    return len(response.data), response.headers.get("Content-Encoding", "identity"), statistics.median(timings)
+
+def main():
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        seed(random.Random(21))
+        before = content_storage()
+        started = time.perf_counter()
+        archived = archive_contents(after_days=-1)
+        elapsed = time.perf_counter() - started
+        if db.engine.dialect.name == "postgresql":
+            # Rewrite the table so dead row versions do not hide the saving
+            db.session.commit()
+            with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(sqlalchemy.text("VACUUM FULL rss_articles"))
+        after = content_storage()
+        print(f"archived {archived} articles in {elapsed:.2f}s")
+        print_storage("before", before)
+        print_storage("after", after)
+        if before["raw_content_bytes"]:
+            print(f"text compression ratio: {before['raw_content_bytes'] / max(after['archive_bytes'], 1):.1f}x")
+
+        db.session.expunge_all()
+        articles = Article.query.options(undefer_group("content")).limit(500).all()
+        started = time.perf_counter()
+        for article in articles:
+            article.content
+        print(f"decompress on re-summarize: {(time.perf_counter() - started) * 1000 / len(articles):.3f} ms per article")
+
+    encodings = [None, "gzip"] + (["br"] if brotli is not None else [])
+    print(f"\n{'path':<28} {'encoding':<9} {'bytes':>10} {'p50 ms':>8}")
+    for path in ["/api/articles?limit=500", "/api/results"]:
+        for encoding in encodings:
+            size, served, p50 = measure_payload(client, path, encoding)
+            print(f"{path:<28} {served:<9} {size:>10,} {p50:>8.1f}")
+
+if __name__ == "__main__":
+    main()
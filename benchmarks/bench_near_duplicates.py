@@ -0,0 +1,112 @@
+"""Near-duplicate clustering speed and accuracy on a synthetic corpus.
+
+Builds a few thousand articles where some are syndicated copies of others
+(a few words edited, an agency header and footer added, sometimes truncated),
+then clusters them with the scraper's MinHash signatures and LSH bands, the
+same way DatabaseManager.flush_articles does against article_fingerprint_bands.
+Reports signature and clustering time, candidate comparisons against the
+all-pairs count, and pairwise precision/recall against the known copies.
+
+    python benchmarks/bench_near_duplicates.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.scraper import lsh_band_hashes, minhash_signature, signature_similarity, find_canonical
+
+ORIGINALS = 2000
+COPIES = 1000
+VOCABULARY = [f"mot{i}" for i in range(8000)]
+HEADER = "Publié le {day} par la rédaction avec AFP Partager sur Facebook Partager sur Twitter Lire aussi"
+FOOTER = "Cet article est réservé aux abonnés Abonnez-vous pour lire la suite Tous droits réservés"
+
+def story(rng):
+    length = rng.randint(150, 1200)
+    # Skewed word choice so unrelated stories share common words, like real text
+    return [VOCABULARY[min(int(rng.expovariate(1 / 800)), len(VOCABULARY) - 1)] for _ in range(length)]
+
+def syndicate(rng, words):
+    words = list(words)
+    for _ in range(rng.randint(1, 5)):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    if rng.random() < 0.3:
+        words = words[:int(len(words) * rng.uniform(0.85, 1.0))]
+    return HEADER.format(day=rng.randint(1, 28)).split() + words + FOOTER.split()
+
+def build_corpus(rng):
+    texts, origin = [], []
+    for i in range(ORIGINALS):
+        texts.append(story(rng))
+        origin.append(i)
+    for _ in range(COPIES):
+        source = rng.randrange(ORIGINALS)
+        texts.append(syndicate(rng, texts[source]))
+        origin.append(source)
+    order = list(range(len(texts)))
+    rng.shuffle(order)
+    return [" ".join(texts[i]) for i in order], [origin[i] for i in order]
+
+def cluster(signatures):
+    """Assign each article to the first earlier article it near-duplicates, via the band index."""
+    bands = defaultdict(list)
+    canonical = {}
+    comparisons = 0
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        hashes = lsh_band_hashes(signature)
+        candidates = {j for h in hashes for j in bands[h]}
+        comparisons += len(candidates)
+        match = find_canonical(signature, [(j, signatures[j]) for j in candidates])
+        if match is not None:
+            canonical[i] = match
+        else:
+            for h in hashes:
+                bands[h].append(i)
+    return canonical, comparisons
+
+def score(canonical, origin):
+    predicted = {(min(i, j), max(i, j)) for i, j in canonical.items()}
+    groups = defaultdict(list)
+    for i, source in enumerate(origin):
+        groups[source].append(i)
+    # A copy is correctly linked when it points at any other member of its group
+    expected = sum(len(members) - 1 for members in groups.values())
+    correct = sum(origin[i] == origin[j] for i, j in predicted)
+    return correct / max(len(predicted), 1), correct / max(expected, 1)
+
+def main():
+    rng = random.Random(16)
+    texts, origin = build_corpus(rng)
+
+    timings = []
+    signatures = []
+    for text in texts:
+        started = time.perf_counter()
+        signatures.append(minhash_signature(text))
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"{len(texts)} articles, signature p50 {statistics.median(timings):.2f} ms, "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95)]:.2f} ms")
+
+    started = time.perf_counter()
+    canonical, comparisons = cluster(signatures)
+    elapsed = time.perf_counter() - started
+    all_pairs = len(texts) * (len(texts) - 1) // 2
+    print(f"clustering: {elapsed * 1000:.0f} ms, {comparisons} signature comparisons (all pairs: {all_pairs})")
+
+    precision, recall = score(canonical, origin)
+    print(f"linked {len(canonical)} duplicates of {COPIES} copies: precision {precision:.3f}, recall {recall:.3f}")
+
+    pairs = [(i, j) for i, j in canonical.items()]
+    if pairs:
+        similarities = sorted(signature_similarity(signatures[i], signatures[j]) for i, j in pairs)
+        print(f"linked pair similarity: min {similarities[0]:.2f}, p50 {statistics.median(similarities):.2f}")
+
+if __name__ == "__main__":
+    main()
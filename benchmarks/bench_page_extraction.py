@@ -0,0 +1,171 @@
+"""Browser-tier extraction time and quality on local HTML fixtures.
+
+Serves a handful of generated article pages from a local HTTP server (plain
+<article>, div soup with comments inside .content, link-heavy related
+stories, text rendered late by JavaScript, a consent banner hiding the text)
+and scrapes each one with:
+
+- the previous extractor: a query_selector/text_content round trip per CSS
+  selector, a fixed 2 s retry wait, then 2 s click attempts per cookie button;
+- ArticleScraper._fetch_via_browser: one in-page scoring script and
+  event-driven waits.
+
+Quality is word-level precision/recall against the fixture's article text.
+Needs Playwright's Chromium (python -m playwright install chromium).
+
+    python benchmarks/bench_page_extraction.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.scraper import ArticleScraper, BOILERPLATE_SELECTORS, CONTENT_SELECTORS
+
+ROUNDS = 3
+WORDS = ("le la les un une des conseil municipal projet restaurant ville quartier habitants maire "
+         "travaux ouverture chef cuisine terrasse saison budget commerce rue place marché").split()
+
+CHROME = """<header><nav><a href="/">Accueil</a> <a href="/politique">Politique</a> <a href="/sport">Sport</a></nav></header>"""
+FOOTER = """<footer><p>Mentions légales - Contact - Plan du site - Tous droits réservés</p></footer>"""
+COMMENTS = """<div class="comments">{}</div>"""
+RELATED = """<div class="related">{}</div>"""
+
+def sentences(rng, count):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30))).capitalize() + "." for _ in range(count)]
+
+def paragraphs(texts):
+    return "".join(f"<p>{text}</p>" for text in texts)
+
+def teasers(rng, count):
+    return "".join(f'<p><a href="/a/{i}">{" ".join(rng.choice(WORDS) for _ in range(20))}</a></p>' for i in range(count))
+
+def build_fixtures(rng):
+    """Return {name: (html, article_text)}."""
+    fixtures = {}
+
+    text = sentences(rng, 12)
+    fixtures["article_tag"] = (
+        f"<html><body>{CHROME}<article><h1>Titre</h1>{paragraphs(text)}</article>{FOOTER}</body></html>", text)
+
+    text = sentences(rng, 10)
+    comments = COMMENTS.format(paragraphs(sentences(rng, 8)))
+    fixtures["div_soup"] = (
+        f'<html><body><div class="content"><div class="menu">{teasers(rng, 6)}</div>'
+        f'<div id="story-body">{paragraphs(text)}</div>{comments}</div>{FOOTER}</body></html>', text)
+
+    text = sentences(rng, 8)
+    fixtures["related_heavy"] = (
+        f'<html><body>{CHROME}<div class="main-column"><div class="post-text">{paragraphs(text)}</div></div>'
+        f'{RELATED.format(teasers(rng, 30))}{FOOTER}</body></html>', text)
+
+    text = sentences(rng, 10)
+    fixtures["late_render"] = (
+        f"""<html><body>{CHROME}<div id="root"></div><script>
+        setTimeout(() => {{ document.getElementById('root').innerHTML = {paragraphs(text)!r}; }}, 800);
+        </script>{FOOTER}</body></html>""", text)
+
+    text = sentences(rng, 10)
+    fixtures["consent_wall"] = (
+        f"""<html><body>{CHROME}
+        <div id="banner" style="position:fixed;bottom:0">Nous utilisons des cookies.
+        <button onclick="document.getElementById('story').style.display='block';this.parentElement.remove()">Tout accepter</button></div>
+        <div id="story" class="article-body" style="display:none">{paragraphs(text)}</div>{FOOTER}</body></html>""", text)
+
+    return fixtures
+
+async def legacy_extract(page) -> str:
+    content = ""
+    for selector in CONTENT_SELECTORS:
+        element = await page.query_selector(selector)
+        if element:
+            content = await element.text_content()
+            if content.strip():
+                break
+    if not content.strip():
+        content = await page.evaluate('''(boilerplate) => {
+            document.querySelectorAll(boilerplate).forEach(el => el.remove());
+            const article = document.querySelector('article');
+            if (article) return article.innerText;
+            const main = document.querySelector('main');
+            if (main) return main.innerText;
+            return Array.from(document.getElementsByTagName('p')).map(p => p.innerText).join('\\n');
+        }''', BOILERPLATE_SELECTORS)
+    return content
+
+async def legacy_fetch(scraper, url: str) -> str:
+    page = await scraper.context.new_page()
+    try:
+        await page.goto(url, wait_until='domcontentloaded')
+        content = await legacy_extract(page)
+        if not content.strip():
+            await page.wait_for_timeout(2000)
+            content = await legacy_extract(page)
+        if scraper._is_restricted(content):
+            for button in ['button:has-text("Accept")', 'button:has-text("Accepter")', 'button:has-text("I agree")',
+                           '.cookie-button', '#cookie-accept']:
+                try:
+                    await page.click(button, timeout=2000)
+                    await page.wait_for_timeout(1000)
+                except Exception:
+                    continue
+            content = await legacy_extract(page)
+        return content.strip()
+    finally:
+        await page.close()
+
+def quality(extracted: str, expected: list) -> tuple:
+    got = Counter(extracted.lower().split())
+    want = Counter(" ".join(expected).lower().split())
+    overlap = sum((got & want).values())
+    return overlap / max(sum(got.values()), 1), overlap / max(sum(want.values()), 1)
+
+def serve(directory: str) -> ThreadingHTTPServer:
+    handler = partial(SimpleHTTPRequestHandler, directory=directory)
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+async def main():
+    fixtures = build_fixtures(random.Random(17))
+    directory = tempfile.mkdtemp()
+    for name, (html, _) in fixtures.items():
+        with open(os.path.join(directory, f"{name}.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+    server = serve(directory)
+
+    scraper = ArticleScraper(None)
+    await scraper.init_browser()
+    extractors = {"legacy": partial(legacy_fetch, scraper), "single-pass": scraper._fetch_via_browser}
+    try:
+        print(f"{'fixture':<14} {'extractor':<12} {'p50 ms':>8} {'precision':>10} {'recall':>8}")
+        totals = {label: [] for label in extractors}
+        for name, (_, expected) in fixtures.items():
+            url = f"http://127.0.0.1:{server.server_port}/{name}.html"
+            for label, fetch in extractors.items():
+                timings = []
+                for _ in range(ROUNDS):
+                    started = time.perf_counter()
+                    content = await fetch(url)
+                    timings.append((time.perf_counter() - started) * 1000)
+                precision, recall = quality(content, expected)
+                totals[label].append(statistics.median(timings))
+                print(f"{name:<14} {label:<12} {statistics.median(timings):>8.0f} {precision:>10.2f} {recall:>8.2f}")
+        for label, timings in totals.items():
+            print(f"{label}: mean {statistics.mean(timings):.0f} ms per page")
+    finally:
+        await scraper.close_browser()
+        server.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,360 @@
+"""Offline replay of the scrape -> select -> summarize -> read pipeline.
+
+Everything runs locally:
+
+- feeds: Google Alerts style Atom feeds, synthetic by default or replayed from
+  a directory written by --record (feeds/*.xml plus pages/<sha1 of url>.html);
+- article pages: served from several local ports so the per-domain limit
+  applies as it does across real news sites, with optional added latency;
+- Mistral: a fake /v1/chat/completions with configurable latency and 429 rate;
+- database: DATABASE_URL (a scratch local Postgres; its tables are dropped) or
+  a temporary SQLite file.
+
+The scrape stage runs the real process_feeds (ArticleScraper + DatabaseManager)
+and needs Postgres, since DatabaseManager uses asyncpg. With SQLite the
+articles are seeded from the fixture pages through the scraper's HTML extractor
+instead. The selection, summary worker and read stages run the real Flask
+routes and app.worker against either database.
+
+Reports throughput, p50/p95/p99 latency and peak memory per stage. Pass several
+--concurrency values to compare CONFIG['max_concurrent_scrapes'] settings.
+
+    python benchmarks/bench_pipeline.py
+    DATABASE_URL=postgresql://localhost/scratch?sslmode=disable python benchmarks/bench_pipeline.py --concurrency 1,2,4,8
+    python benchmarks/bench_pipeline.py --record fixtures/   # snapshot the live feeds once
+    python benchmarks/bench_pipeline.py --fixtures fixtures/
+"""
+import argparse
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, urlparse
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MISTRAL_API_KEY", "benchmark")
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+import asyncpg
+import feedparser
+import httpx
+
+from app import create_app, db
+from app import scraper as scraper_module
+from app import worker
+from app.metrics import metrics
+from app.mistral import MISTRAL_CONFIG
+from app.models import Article
+
+WORDS = ("le la les un une des conseil municipal projet restaurant ville quartier habitants maire travaux "
+         "ouverture chef cuisine terrasse saison budget commerce rue place marché étoile menu produits").split()
+
+def url_key(url: str) -> str:
+    return hashlib.sha1(url.encode()).hexdigest()
+
+# --- Fixtures -------------------------------------------------------------------
+
+def synthetic_fixtures(feed_count: int, entries_per_feed: int, sites: int, duplicate_rate: float, rng) -> tuple:
+    """Return ({feed name: [(title, url, published)]}, {url key: html}) for made-up articles."""
+    feeds, pages = {}, {}
+    bodies = []
+    for f in range(feed_count):
+        entries = []
+        for e in range(entries_per_feed):
+            url = f"https://site{rng.randrange(sites)}.example/{f}/{e}"
+            if bodies and rng.random() < duplicate_rate:
+                body = rng.choice(bodies)  # Syndicated copy of an earlier story
+            else:
+                body = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(15, 35))) + "." for _ in range(rng.randint(6, 14))]
+                bodies.append(body)
+            title = " ".join(rng.choice(WORDS) for _ in range(6)).capitalize()
+            pages[url_key(url)] = (
+                f"<html><head><title>{title}</title></head><body><header><nav><a href='/'>Accueil</a></nav></header>"
+                f"<article><h1>{title}</h1>{''.join(f'<p>{p}</p>' for p in body)}</article>"
+                f"<footer><p>Tous droits réservés</p></footer></body></html>"
+            )
+            entries.append((title, url, f"2026-10-{1 + e % 28:02d}T08:00:00Z"))
+        feeds[f"feed{f}"] = entries
+    return feeds, pages
+
+def load_fixtures(directory: str) -> tuple:
+    feeds, pages = {}, {}
+    for path in sorted(glob.glob(os.path.join(directory, "feeds", "*.xml"))):
+        parsed = feedparser.parse(path)
+        feeds[os.path.splitext(os.path.basename(path))[0]] = [
+            (entry.title, scraper_module.ArticleScraper.extract_real_link(entry.link),
+             entry.get("published", "2026-10-01T08:00:00Z"))
+            for entry in parsed.entries
+        ]
+    for path in glob.glob(os.path.join(directory, "pages", "*.html")):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return feeds, pages
+
+async def record_fixtures(directory: str):
+    """Snapshot the configured live feeds and the pages they link to."""
+    os.makedirs(os.path.join(directory, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(directory, "pages"), exist_ok=True)
+    async with httpx.AsyncClient(headers={"User-Agent": scraper_module.USER_AGENT}, follow_redirects=True,
+                                 timeout=20) as client:
+        for i, feed_url in enumerate(scraper_module.configured_feeds()):
+            response = await client.get(feed_url)
+            with open(os.path.join(directory, "feeds", f"feed{i}.xml"), "wb") as f:
+                f.write(response.content)
+            for entry in feedparser.parse(response.content).entries:
+                url = scraper_module.ArticleScraper.extract_real_link(entry.link)
+                try:
+                    page = await client.get(url)
+                except httpx.HTTPError as e:
+                    print(f"skipped {url}: {e!r}")
+                    continue
+                with open(os.path.join(directory, "pages", f"{url_key(url)}.html"), "w", encoding="utf-8") as f:
+                    f.write(page.text)
+            print(f"recorded {feed_url}")
+
+def atom_feed(name: str, entries: list, site_url) -> bytes:
+    items = "".join(
+        f"<entry><id>tag:google.com,2013:googlealerts/feed:{url_key(url)}</id>"
+        f"<title type=\"html\">{escape(title)}</title>"
+        f"<link href=\"https://www.google.com/url?rct=j&amp;sa=t&amp;url={quote(site_url(url), safe='')}&amp;ct=ga\"/>"
+        f"<published>{published}</published><updated>{published}</updated></entry>"
+        for title, url, published in entries
+    )
+    return (f"<?xml version=\"1.0\" encoding=\"utf-8\"?><feed xmlns=\"http://www.w3.org/2005/Atom\">"
+            f"<id>tag:google.com,2005:reader/user/{name}</id><title>Google Alert - {name}</title>{items}</feed>").encode()
+
+# --- Local servers --------------------------------------------------------------
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path.startswith("/feeds/") and path[len("/feeds/"):] in self.server.feeds:
+            self.send_body(200, self.server.feeds[path[len("/feeds/"):]], "application/atom+xml")
+        elif path.startswith("/pages/") and path[len("/pages/"):] in self.server.pages:
+            time.sleep(self.server.page_latency * random.uniform(0.5, 1.5))
+            self.send_body(200, self.server.pages[path[len("/pages/"):]].encode(), "text/html; charset=utf-8")
+        else:
+            self.send_body(404, b"not found", "text/plain")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if urlparse(self.path).path != "/v1/chat/completions":
+            self.send_body(404, b"not found", "text/plain")
+            return
+        if random.random() < self.server.mistral_429_rate:
+            self.send_body(429, b'{"message": "rate limited"}', "application/json", {"Retry-After": "0.2"})
+            return
+        # Latency grows with the prompt, like a real completion
+        prompt = json.loads(body)["messages"][0]["content"]
+        time.sleep(self.server.mistral_latency * random.uniform(0.5, 1.5) * (1 + len(prompt) / 20000))
+        reply = {"choices": [{"message": {"content": "Résumé : " + " ".join(prompt.split()[-40:])}}]}
+        self.send_body(200, json.dumps(reply).encode(), "application/json")
+
+def start_server(**state) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReplayHandler)
+    server.daemon_threads = True
+    for name, value in state.items():
+        setattr(server, name, value)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# --- Measurement ----------------------------------------------------------------
+
+def percentiles(values: list) -> str:
+    if not values:
+        return "n/a"
+    ordered = sorted(values)
+    pick = lambda fraction: ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+    return f"p50 {pick(0.5) * 1000:.0f} ms, p95 {pick(0.95) * 1000:.0f} ms, p99 {pick(0.99) * 1000:.0f} ms"
+
+def peak_memory() -> str:
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    _, traced = tracemalloc.get_traced_memory()
+    return f"peak RSS {own:.0f} MB (children {children:.0f} MB), Python heap peak {traced / 2**20:.1f} MB"
+
+def histogram_series(snapshot: dict, prefix: str) -> dict:
+    return {series: timing for series, timing in snapshot["timings"].items() if series.startswith(prefix)}
+
+def report_stage(name: str, count: int, elapsed: float, latencies: list = None, unit: str = "items"):
+    rate = count / elapsed if elapsed else 0.0
+    line = f"[{name}] {count} {unit} in {elapsed:.2f}s ({rate:.1f}/s)"
+    if latencies is not None:
+        line += f"; {percentiles(latencies)}"
+    print(line + f"; {peak_memory()}")
+    tracemalloc.reset_peak()
+
+# --- Stages ---------------------------------------------------------------------
+
+def asyncpg_url(url: str) -> str:
+    return re.sub(r"^postgres(ql)?\+\w+://", "postgresql://", url)
+
+async def reset_postgres(url: str):
+    conn = await asyncpg.connect(asyncpg_url(url))
+    try:
+        await conn.execute("DROP TABLE IF EXISTS article_fingerprint_bands, article_fingerprints, "
+                           "rss_articles, rss_feeds, alembic_version CASCADE")
+    finally:
+        await conn.close()
+
+async def scrape_stage(url: str, feed_urls: list, concurrency: int):
+    await reset_postgres(url)
+    scraper_module.CONFIG["max_concurrent_scrapes"] = concurrency
+    os.environ["RSS_FEEDS"] = ",".join(feed_urls)
+    metrics.reset()
+    started = time.perf_counter()
+    await scraper_module.run(scraper_module.DatabaseManager(asyncpg_url(url)))
+    elapsed = time.perf_counter() - started
+
+    snapshot = metrics.snapshot()
+    stored = snapshot["counters"].get('scraper_entries_total{result="stored"}', 0)
+    report_stage(f"scrape x{concurrency}", int(stored), elapsed, unit="articles")
+    for series, timing in histogram_series(snapshot, "scraper_").items():
+        print(f"    {series}: n={timing['count']} mean {timing['mean_s'] * 1000:.1f} ms, "
+              f"p95 <= {timing['p95_s'] * 1000:.0f} ms")
+
+def seed_sqlite(feeds: dict, pages: dict):
+    db.drop_all()
+    db.create_all()
+    started = time.perf_counter()
+    rows = []
+    for entries in feeds.values():
+        for title, url, published in entries:
+            html = pages.get(url_key(url))
+            if html:
+                content = scraper_module.ArticleScraper._extract_html_content(html)
+                rows.append({"title": title, "raw_content": content, "link": url, "date": published[:10],
+                             "content_hash": scraper_module.content_hash(content),
+                             "summary": "", "keyword": "", "status": "out"})
+    rows = list({row["link"]: row for row in rows}.values())
+    db.session.bulk_insert_mappings(Article, rows)
+    db.session.commit()
+    report_stage("seed (SQLite, no scrape)", len(rows), time.perf_counter() - started, unit="articles")
+
+def select_stage(client, selected: int):
+    ids = [row["id"] for row in client.get("/api/articles?fields=id&limit=500").json["articles"]][:selected]
+    started = time.perf_counter()
+    response = client.post("/api/update-selection", json={str(article_id): "in" for article_id in ids})
+    report_stage("select", response.json.get("queued", 0), time.perf_counter() - started, unit="queued")
+
+def summarize_stage(app, concurrency: int):
+    with app.app_context():
+        pending = Article.query.filter_by(summary_status="pending").count()
+    metrics.reset()
+    worker.WORKER_CONFIG["concurrency"] = concurrency
+    started = time.perf_counter()
+    with app.app_context():
+        asyncio.run(worker.drain_queue())
+    elapsed = time.perf_counter() - started
+    snapshot = metrics.snapshot()
+    report_stage("summarize", pending, elapsed, unit="summaries")
+    for series, timing in histogram_series(snapshot, "mistral_").items():
+        print(f"    {series}: n={timing['count']} mean {timing['mean_s'] * 1000:.0f} ms, "
+              f"p95 <= {timing['p95_s'] * 1000:.0f} ms")
+    retried = sum(v for k, v in snapshot["counters"].items() if k.startswith("mistral_requests_total") and '"429"' in k)
+    print(f"    429 responses retried: {retried:.0f}")
+
+def read_stage(client, requests: int):
+    for path in ["/api/articles?limit=100", "/api/results"]:
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started = time.perf_counter()
+            client.get(path)
+            latencies.append(time.perf_counter() - request_started)
+        report_stage(f"GET {path}", requests, time.perf_counter() - started, latencies, unit="requests")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay the scrape and summarize pipeline against local fakes.")
+    parser.add_argument("--fixtures", help="replay feeds/*.xml and pages/*.html from this directory")
+    parser.add_argument("--record", help="snapshot the live feeds and pages into this directory, then exit")
+    parser.add_argument("--feeds", type=int, default=4, help="synthetic feeds (default 4)")
+    parser.add_argument("--entries", type=int, default=50, help="synthetic entries per feed (default 50)")
+    parser.add_argument("--sites", type=int, default=8, help="distinct local sites serving pages (default 8)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1, help="share of syndicated copies (default 0.1)")
+    parser.add_argument("--page-latency", type=float, default=0.05, help="mean page response time in s")
+    parser.add_argument("--concurrency", default=str(scraper_module.CONFIG["max_concurrent_scrapes"]),
+                        help="comma-separated max_concurrent_scrapes values to compare")
+    parser.add_argument("--rps", type=float, default=0, help="scraper max_requests_per_second (0 = unlimited)")
+    parser.add_argument("--mistral-latency", type=float, default=0.3, help="mean fake Mistral latency in s")
+    parser.add_argument("--mistral-429-rate", type=float, default=0.05, help="share of fake Mistral 429s")
+    parser.add_argument("--mistral-rps", type=float, default=20, help="client-side Mistral rate limit")
+    parser.add_argument("--worker-concurrency", type=int, default=4)
+    parser.add_argument("--select", type=int, default=100, help="articles selected for summaries")
+    parser.add_argument("--read-requests", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record_fixtures(args.record))
+        return
+
+    rng = random.Random(20)
+    if args.fixtures:
+        feeds, pages = load_fixtures(args.fixtures)
+    else:
+        feeds, pages = synthetic_fixtures(args.feeds, args.entries, args.sites, args.duplicate_rate, rng)
+
+    # One server per site so each has its own host:port, i.e. its own per-domain
+    # limit; an article's original domain always maps to the same local site
+    page_servers = [start_server(feeds={}, pages=pages, page_latency=args.page_latency) for _ in range(args.sites)]
+    site_for = lambda url: page_servers[int(url_key(urlparse(url).netloc), 16) % len(page_servers)]
+    site_url = lambda url: f"http://127.0.0.1:{site_for(url).server_port}/pages/{url_key(url)}"
+    feed_server = start_server(feeds={f"{name}.xml": atom_feed(name, entries, site_url) for name, entries in feeds.items()},
+                               pages={}, page_latency=0)
+    fake_mistral = start_server(feeds={}, pages={}, mistral_latency=args.mistral_latency,
+                                mistral_429_rate=args.mistral_429_rate)
+
+    MISTRAL_CONFIG["base_url"] = f"http://127.0.0.1:{fake_mistral.server_port}"
+    MISTRAL_CONFIG["requests_per_second"] = args.mistral_rps
+    MISTRAL_CONFIG["burst"] = max(1, int(args.mistral_rps))
+    MISTRAL_CONFIG["backoff_base"] = 0.1
+    scraper_module.CONFIG["max_requests_per_second"] = args.rps
+    scraper_module.CONFIG["max_scrapes_per_domain"] = max(scraper_module.CONFIG["max_scrapes_per_domain"], 1)
+
+    entry_count = sum(len(entries) for entries in feeds.values())
+    database = os.environ["DATABASE_URL"]
+    print(f"{len(feeds)} feeds, {entry_count} entries, {len(page_servers)} sites, database {urlparse(database).scheme}")
+    tracemalloc.start()
+
+    app = create_app()
+    client = app.test_client()
+    if database.startswith("postgres"):
+        feed_urls = [f"http://127.0.0.1:{feed_server.server_port}/feeds/{name}.xml" for name in feeds]
+        for concurrency in [int(value) for value in args.concurrency.split(",")]:
+            asyncio.run(scrape_stage(database, feed_urls, concurrency))
+    else:
+        with app.app_context():
+            seed_sqlite(feeds, pages)
+
+    select_stage(client, args.select)
+    summarize_stage(app, args.worker_concurrency)
+    read_stage(client, args.read_requests)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""/api/search latency over a realistically sized article table.
+
+Seeds ARTICLE_COUNT articles of generated French text (each naming one of a
+few hundred towns, so some queries are selective and others match a large
+share of the table), applies the migrations so the search index exists, then
+reports p50/p95 server time and the number of matches for a set of queries:
+a rare word, a frequent word, a phrase, several words, an OR and an exclusion.
+Only the newest SEARCH_RANK_CANDIDATES matches are ranked by default, so each
+query is also timed with ?exhaustive=1, which ranks every match. Deep pages
+are timed too, since results are paged by offset.
+
+Runs against DATABASE_URL when set (use a scratch database, the tables are
+rebuilt), otherwise a temporary SQLite file.
+
+    python benchmarks/bench_search.py [article_count]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MISTRAL_API_KEY", "benchmark")
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+import sqlalchemy
+from flask_migrate import upgrade
+
+from app import create_app, db
+from app.models import Article
+
+ARTICLE_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+INSERT_BATCH = 2000
+ROUNDS = 30
+WORDS = ("le la les un une des du de et à en pour avec sur dans par conseil municipal projet restaurant ville "
+         "quartier habitants maire travaux ouverture chef cuisine terrasse saison budget commerce rue place "
+         "marché étoilé menu produits locaux gastronomie établissement clientèle réservation service").split()
+TOWNS = [f"{prefix}{suffix}" for prefix in ("Saint", "Mont", "Ville", "Belle", "Roche", "Fontaine", "Bois", "Val")
+         for suffix in ("ardent", "bourg", "mare", "court", "laval", "pierre", "sur-mer", "les-bains", "neuve",
+                        "rousse", "franche", "haute", "basse", "dieu", "marie", "claire", "forêt", "vigne",
+                        "sable", "lac", "pont", "champ", "roc", "fleur", "mont", "clos", "moulin", "grange",
+                        "étang", "bourgeon")]
+QUERIES = [
+    ("rare word", "Rochemoulin"),
+    ("frequent word", "restaurant"),
+    ("phrase", '"chef étoilé"'),
+    ("several words", "terrasse quartier ouverture"),
+    ("or", "Valpont or Boisclos"),
+    ("exclusion", "gastronomie -budget"),
+]
+
+def paragraph(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 80))).capitalize() + "."
+
+def rebuild_schema():
+    db.drop_all()
+    with db.engine.begin() as conn:
+        conn.execute(sqlalchemy.text("DROP TABLE IF EXISTS alembic_version"))
+        if db.engine.dialect.name == "sqlite":
+            conn.execute(sqlalchemy.text("DROP TABLE IF EXISTS rss_articles_fts"))
+    upgrade()
+
+def seed(rng):
+    rebuild_schema()
+    for start in range(0, ARTICLE_COUNT, INSERT_BATCH):
+        rows = []
+        for i in range(start, min(start + INSERT_BATCH, ARTICLE_COUNT)):
+            town = rng.choice(TOWNS)
+            text = "\n".join(paragraph(rng) for _ in range(rng.randint(3, 10)))
+            rows.append({
+                "title": f"{town} : {paragraph(rng)[:60]}", "raw_content": f"{text} {town}.",
+                "summary": paragraph(rng), "keyword": "restaurant", "link": f"https://example.com/{i}",
+                "status": "out"
+            })
+        db.session.bulk_insert_mappings(Article, rows)
+        db.session.commit()
+    if db.engine.dialect.name == "postgresql":
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(sqlalchemy.text("VACUUM ANALYZE rss_articles"))
+
+def measure(client, path):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+    assert response.status_code == 200, response.data
+    timings.sort()
+    return response.get_json(), statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+def count_matches(client, query, exhaustive):
+    # Pages through every result, so also checks pagination does not repeat or skip rows
+    ids, offset, truncated = [], 0, False
+    while offset is not None:
+        page = client.get("/api/search", query_string={"q": query, "limit": 500, "offset": offset,
+                                                       "fields": "id", "exhaustive": int(exhaustive)}).get_json()
+        ids += [result["id"] for result in page["results"]]
+        offset = page["next_offset"]
+        truncated = truncated or page["truncated"]
+    assert len(ids) == len(set(ids)), "duplicate results across pages"
+    return len(ids), truncated
+
+def main():
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        started = time.perf_counter()
+        seed(random.Random(22))
+        print(f"seeded {ARTICLE_COUNT} articles on {db.engine.dialect.name} in {time.perf_counter() - started:.1f}s")
+
+    print(f"\n{'query':<15} {'q':<30} {'matches':>8} {'ranked':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'all p50':>8} {'all p95':>8}")
+    for label, query in QUERIES:
+        page, p50, p95 = measure(client, f"/api/search?q={query}&fields=id,title")
+        _, all_p50, all_p95 = measure(client, f"/api/search?q={query}&fields=id,title&exhaustive=1")
+        matches, _ = count_matches(client, query, exhaustive=True)
+        ranked, truncated = count_matches(client, query, exhaustive=False)
+        assert truncated == (ranked < matches), "truncated flag does not match the result count"
+        print(f"{label:<15} {query:<30} {matches:>8} {ranked:>8} {p50:>8.1f} {p95:>8.1f} {all_p50:>8.1f} {all_p95:>8.1f}")
+        if label == "rare word":
+            assert all("Rochemoulin" in result["title"] for result in page["results"]), "title matches rank first"
+
+    print(f"\n{'page':<15} {'offset':<30} {'results':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for exhaustive, offsets in ((0, (0, 200, 480)), (1, (0, 1000, 5000))):
+        for offset in offsets:
+            page, p50, p95 = measure(
+                client, f"/api/search?q=restaurant&fields=id&limit=20&offset={offset}&exhaustive={exhaustive}"
+            )
+            label = "exhaustive" if exhaustive else "ranked"
+            print(f"{label:<15} {offset:<30} {len(page['results']):>8} {p50:>8.1f} {p95:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Latency of POST /api/update-selection against selection size.
+
+Runs against DATABASE_URL when set (use a scratch database, the table is
+rebuilt), otherwise a temporary SQLite file. Compares the set-based endpoint
+with the previous one-query-per-article loop.
+
+    python benchmarks/bench_update_selection.py
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("MISTRAL_API_KEY", "benchmark")
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+from app import create_app, db
+from app.models import Article
+
+ARTICLE_COUNT = 5000
+SELECTION_SIZES = [10, 100, 300, 1000]
+ROUNDS = 5
+
+def seed():
+    db.drop_all()
+    db.create_all()
+    db.session.bulk_insert_mappings(Article, [
+        {"title": f"Article {i}", "raw_content": "", "link": f"https://example.com/{i}", "status": "out"}
+        for i in range(ARTICLE_COUNT)
+    ])
+    db.session.commit()
+
+def random_selection(size):
+    ids = random.sample(range(1, ARTICLE_COUNT + 1), size)
+    return {str(article_id): random.choice(["in", "out"]) for article_id in ids}
+
+def legacy_update(selections):
+    for article_id, status in selections.items():
+        article = db.session.get(Article, int(article_id))
+        if article:
+            article.status = "in" if status == "in" else "out"
+    db.session.commit()
+
+def measure(fn):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def main():
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        seed()
+
+    print(f"{'size':>6} {'set-based ms':>14} {'per-row ms':>12}")
+    for size in SELECTION_SIZES:
+        selections = random_selection(size)
+        bulk = measure(lambda: client.post("/api/update-selection", json=selections))
+        with app.app_context():
+            legacy = measure(lambda: legacy_update(selections))
+        print(f"{size:>6} {bulk:>14.1f} {legacy:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ document.addEventListener("DOMContentLoaded", function () {
     loadingIndicator.id = "loading";
     loadingIndicator.style.textAlign = "center";
     loadingIndicator.style.marginTop = "20px";
-    loadingIndicator.innerHTML = '<div class="spinner"></div><p>Generating summaries (10-20s)...</p>';
+    loadingIndicator.innerHTML = '<div class="spinner"></div><p>Generating summaries...</p>';
     const backendUrl = "https://restaurants-scrap.onrender.com/api";
 
     // Add spinner CSS
@@ -30,33 +30,152 @@ document.addEventListener("DOMContentLoaded", function () {
 
     articlesDiv.innerHTML = "<p>Loading articles...</p>";
 
-    fetch(`${backendUrl}/articles`, { timeout: 30000 })
-        .then(response => {
+    // Articles are fetched a page at a time; later pages only load when asked
+    // for, so opening the page does not download the whole table
+    const articlesPageSize = 100;
+    const loadMoreButton = document.createElement("button");
+    loadMoreButton.type = "button"; // Not a submit button of the form
+    loadMoreButton.textContent = "Load more articles";
+    loadMoreButton.style.display = "none";
+    articlesDiv.after(loadMoreButton);
+    let nextCursor = null;
+
+    function renderArticles(articles) {
+        articles.forEach(article => {
+            articlesDiv.insertAdjacentHTML("beforeend", `
+                <label>
+                    <input type="radio" name="article_${article.id}" value="in"> In
+                    <input type="radio" name="article_${article.id}" value="out"> Out
+                    ${article.title}
+                </label><br>
+            `);
+        });
+    }
+
+    function loadArticles(after) {
+        loadMoreButton.disabled = true;
+        const params = new URLSearchParams({ limit: articlesPageSize, fields: "id,title" });
+        if (after) params.set("after", after);
+
+        fetch(`${backendUrl}/articles?${params}`, { timeout: 30000 })
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+                return response.json();
+            })
+            .then(data => {
+                if (!after) {
+                    articlesDiv.innerHTML = "";
+                    if (data.articles.length === 0) {
+                        articlesDiv.innerHTML = "<p class='error'>No articles found. Try again later.</p>";
+                        return;
+                    }
+                }
+
+                renderArticles(data.articles);
+                nextCursor = data.next_cursor;
+                loadMoreButton.style.display = nextCursor ? "" : "none";
+            })
+            .catch(error => {
+                console.error("Error loading articles:", error);
+                articlesDiv.insertAdjacentHTML("beforeend", `<p class='error'>Error loading articles: ${error.message}. Check console for details.</p>`);
+            })
+            .finally(() => { loadMoreButton.disabled = false; });
+    }
+
+    loadMoreButton.addEventListener("click", () => loadArticles(nextCursor));
+
+    loadArticles(null);
+
+    // Summaries are generated in the background. /results/stream sends one JSON
+    // line per article, cached summaries first and pending placeholders after
+    // them, then each pending one again when it is ready; the last line lists
+    // anything still pending, and we reconnect for those. Reconnects back off
+    // exponentially and give up after a few that bring no new summary, e.g.
+    // when no worker is draining the queue.
+    const results = new Map();
+    const maxIdleReconnects = 5;
+    const maxReconnectDelay = 60000;
+    let reconnectTimer = null;
+
+    function pendingCount() {
+        return Array.from(results.values()).filter(result => result.status === "pending").length;
+    }
+
+    function renderResults() {
+        const entries = Array.from(results.values());
+        const pending = pendingCount();
+        let summaryTextContent = "";
+        entries.forEach(result => {
+            const title = result.title || 'Untitled';
+            const summary = result.status === "pending"
+                ? "Summary in progress..."
+                : (result.summary || 'No summary available');
+            summaryTextContent += `Title: ${title}\nSummary: ${summary}\n\n`; // Handle missing data
+        });
+        if (summaryTextContent.includes("No summary available")) {
+            summaryTextContent += "\nNote: Some articles may lack summaries due to missing content or API issues.";
+        }
+        summaryText.textContent = summaryTextContent.trim(); // Set the text in the pre element
+        loadingIndicator.querySelector("p").textContent = `Generating summaries (${pending} remaining)...`;
+    }
+
+    function handleLine(line) {
+        if (!line.trim()) return false;
+        const message = JSON.parse(line);
+        if (message.pending) {
+            // End of stream
+            message.pending.forEach(id => {
+                if (results.has(id)) results.get(id).status = "pending";
+            });
+            renderResults();
+            return message.pending.length > 0;
+        }
+        results.set(message.id, message);
+        renderResults();
+        return false;
+    }
+
+    async function loadResults(idleReconnects = 0, pendingBefore = Infinity) {
+        reconnectTimer = null;
+        try {
+            const response = await fetch(`${backendUrl}/results/stream`);
             if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
-            return response.json();
-        })
-        .then(data => {
-            articlesDiv.innerHTML = "";
 
-            if (data.length === 0) {
-                articlesDiv.innerHTML = "<p class='error'>No articles found. Try again later.</p>";
-                return;
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = "";
+            let reconnect = false;
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split("\n");
+                buffer = lines.pop();
+                lines.forEach(line => { reconnect = handleLine(line) || reconnect; });
             }
+            reconnect = handleLine(buffer) || reconnect;
 
-            data.forEach(article => {
-                articlesDiv.innerHTML += `
-                    <label>
-                        <input type="radio" name="article_${article.id}" value="in"> In
-                        <input type="radio" name="article_${article.id}" value="out"> Out
-                        ${article.title}
-                    </label><br>
-                `;
-            });
-        })
-        .catch(error => {
-            console.error("Error loading articles:", error);
-            articlesDiv.innerHTML = `<p class='error'>Error loading articles: ${error.message}. Check console for details.</p>`;
-        });
+            if (reconnect) {
+                const pending = pendingCount();
+                const idle = pending < pendingBefore ? 0 : idleReconnects + 1;
+                if (idle < maxIdleReconnects) {
+                    const delay = Math.min(1000 * 2 ** idle, maxReconnectDelay);
+                    reconnectTimer = setTimeout(() => loadResults(idle, pending), delay);
+                    return;
+                }
+                summariesDiv.insertAdjacentHTML("beforeend", `<p class='error'>${pending} summaries are still being generated. Reload the page later to see them.</p>`);
+            }
+            if (results.size === 0) {
+                summaryText.textContent = "No summaries available for selected articles.";
+            }
+            loadingIndicator.remove(); // Remove loading animation
+        } catch (err) {
+            console.error("Error loading results:", err);
+            loadingIndicator.remove(); // Remove loading animation on error
+            summariesDiv.insertAdjacentHTML("beforeend", `<p class='error'>Failed to load summaries: ${err.message}. Please try again later.</p>`);
+            alert(`Failed to load summaries: ${err.message}. Please try again later.`);
+        }
+    }
 
     // Handle form submission
     document.getElementById("articleForm").addEventListener("submit", function (event) {
@@ -84,42 +203,12 @@ document.addEventListener("DOMContentLoaded", function () {
                 alert("Selection saved!");
                 // Show loading animation
                 summariesDiv.style.display = "block";
-                summariesDiv.innerHTML = "";
+                summaryText.textContent = "";
                 summariesDiv.appendChild(loadingIndicator);
 
-                // Fetch and display summaries with longer timeout
-                fetch(`${backendUrl}/results`, { timeout: 30000 })
-                    .then(resp => {
-                        if (!resp.ok) throw new Error(`HTTP error! status: ${resp.status}`);
-                        return resp.json();
-                    })
-                    .then(results => {
-                        console.log("Results from /api/results:", results);  // Debug log
-                        loadingIndicator.remove(); // Remove loading animation
-                        let summaryTextContent = "";
-                        if (results.length === 0) {
-                            summaryTextContent = "No summaries available for selected articles.";
-                        } else {
-                            results.forEach(result => {
-                                const title = result.title || 'Untitled';
-                                const summary = result.summary || 'No summary available';
-                                summaryTextContent += `Title: ${title}\nSummary: ${summary}\n\n`; // Handle missing data
-                                console.log(`Processing result - Title: ${title}, Summary: ${summary}`);  // Debug each result
-                            });
-                        }
-                        if (!summaryTextContent.trim()) {
-                            summaryTextContent = "No valid summaries available.";
-                        } else if (summaryTextContent.includes("No summary available")) {
-                            summaryTextContent += "\nNote: Some articles may lack summaries due to missing content or API issues.";
-                        }
-                        summaryText.textContent = summaryTextContent.trim(); // Set the text in the pre element
-                    })
-                    .catch(err => {
-                        console.error("Error loading results:", err);
-                        loadingIndicator.remove(); // Remove loading animation on error
-                        summariesDiv.innerHTML = `<p class='error'>Failed to load summaries: ${err.message}. Please try again later.</p>`;
-                        alert(`Failed to load summaries: ${err.message}. Please try again later.`);
-                    });
+                clearTimeout(reconnectTimer);
+                results.clear();
+                loadResults();
             })
             .catch(error => {
                 console.error("Error submitting selection:", error);
@@ -0,0 +1,52 @@
+"""rss_articles baseline
+
+Databases created by the scraper or db.create_all before migrations existed
+already have the table, so this only creates what is missing.
+
+Revision ID: 0001_rss_articles
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_rss_articles'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('rss_articles'):
+        op.create_table(
+            'rss_articles',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('date', sa.Text()),
+            sa.Column('title', sa.Text(), nullable=False),
+            sa.Column('raw_content', sa.Text()),
+            sa.Column('summary', sa.Text()),
+            sa.Column('keyword', sa.Text()),
+            sa.Column('link', sa.Text(), unique=True),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+            sa.Column('status', sa.Text(), server_default='out'),
+        )
+        existing = set()
+    else:
+        existing = {column['name'] for column in inspector.get_columns('rss_articles')}
+
+    # Columns added after the table was first created by the scraper
+    with op.batch_alter_table('rss_articles') as batch_op:
+        if 'summary_key' not in existing:
+            batch_op.add_column(sa.Column('summary_key', sa.Text()))
+        if 'summary_status' not in existing:
+            batch_op.add_column(sa.Column('summary_status', sa.Text()))
+        if 'updated_at' not in existing:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()))
+
+
+def downgrade():
+    op.drop_table('rss_articles')
@@ -0,0 +1,36 @@
+"""index status, created_at and date; drop duplicate link indexes
+
+link already gets a unique index from its UNIQUE constraint. The old scraper
+DDL declared UNIQUE twice (a second rss_articles_link_key1 constraint on
+Postgres) on top of idx_link.
+
+Revision ID: 0002_article_indexes
+Revises: 0001_rss_articles
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_article_indexes'
+down_revision = '0001_rss_articles'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('DROP INDEX IF EXISTS idx_link')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE rss_articles DROP CONSTRAINT IF EXISTS rss_articles_link_key1')
+
+    op.execute('CREATE INDEX IF NOT EXISTS idx_rss_articles_status ON rss_articles (status)')
+    op.execute('CREATE INDEX IF NOT EXISTS idx_rss_articles_created_at ON rss_articles (created_at)')
+    op.execute('CREATE INDEX IF NOT EXISTS idx_rss_articles_date ON rss_articles (date)')
+
+
+def downgrade():
+    op.drop_index('idx_rss_articles_date', table_name='rss_articles')
+    op.drop_index('idx_rss_articles_created_at', table_name='rss_articles')
+    op.drop_index('idx_rss_articles_status', table_name='rss_articles')
+    op.create_index('idx_link', 'rss_articles', ['link'])
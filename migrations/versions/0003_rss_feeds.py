@@ -0,0 +1,35 @@
+"""rss_feeds table for per-feed polling state
+
+Revision ID: 0003_rss_feeds
+Revises: 0002_article_indexes
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_rss_feeds'
+down_revision = '0002_article_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The scraper may already have created it through SCHEMA_SQL
+    if sa.inspect(op.get_bind()).has_table('rss_feeds'):
+        return
+    op.create_table(
+        'rss_feeds',
+        sa.Column('url', sa.Text(), primary_key=True),
+        sa.Column('enabled', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('etag', sa.Text()),
+        sa.Column('modified', sa.Text()),
+        sa.Column('seen_ids', sa.Text()),
+        sa.Column('last_polled_at', sa.DateTime()),
+    )
+
+
+def downgrade():
+    op.drop_table('rss_feeds')
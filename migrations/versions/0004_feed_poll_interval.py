@@ -0,0 +1,28 @@
+"""per-feed poll interval for the scraper daemon
+
+Revision ID: 0004_feed_poll_interval
+Revises: 0003_rss_feeds
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_feed_poll_interval'
+down_revision = '0003_rss_feeds'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('rss_feeds')}
+    if 'poll_interval' not in columns:
+        with op.batch_alter_table('rss_feeds') as batch_op:
+            batch_op.add_column(sa.Column('poll_interval', sa.Integer()))
+
+
+def downgrade():
+    with op.batch_alter_table('rss_feeds') as batch_op:
+        batch_op.drop_column('poll_interval')
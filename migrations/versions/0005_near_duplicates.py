@@ -0,0 +1,50 @@
+"""canonical_id and MinHash fingerprint tables for near-duplicate articles
+
+Revision ID: 0005_near_duplicates
+Revises: 0004_feed_poll_interval
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_near_duplicates'
+down_revision = '0004_feed_poll_interval'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('rss_articles')}
+    if 'canonical_id' not in columns:
+        with op.batch_alter_table('rss_articles') as batch_op:
+            batch_op.add_column(sa.Column('canonical_id', sa.Integer()))
+            batch_op.create_foreign_key('rss_articles_canonical_id_fkey', 'rss_articles',
+                                        ['canonical_id'], ['id'], ondelete='SET NULL')
+    op.execute('CREATE INDEX IF NOT EXISTS idx_rss_articles_canonical_id ON rss_articles (canonical_id)')
+
+    if not inspector.has_table('article_fingerprints'):
+        op.create_table(
+            'article_fingerprints',
+            sa.Column('article_id', sa.Integer(), sa.ForeignKey('rss_articles.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('signature', sa.LargeBinary(), nullable=False),
+        )
+    if not inspector.has_table('article_fingerprint_bands'):
+        op.create_table(
+            'article_fingerprint_bands',
+            sa.Column('band_hash', sa.BigInteger(), primary_key=True, autoincrement=False),
+            sa.Column('article_id', sa.Integer(), sa.ForeignKey('article_fingerprints.article_id', ondelete='CASCADE'),
+                      primary_key=True),
+        )
+
+
+def downgrade():
+    op.drop_table('article_fingerprint_bands')
+    op.drop_table('article_fingerprints')
+    op.drop_index('idx_rss_articles_canonical_id', table_name='rss_articles')
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.drop_constraint('rss_articles_canonical_id_fkey', type_='foreignkey')
+        batch_op.drop_column('canonical_id')
@@ -0,0 +1,28 @@
+"""compressed raw_content archive column
+
+Revision ID: 0006_raw_content_archive
+Revises: 0005_near_duplicates
+Create Date: 2026-10-17 00:00:05.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_raw_content_archive'
+down_revision = '0005_near_duplicates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('rss_articles')}
+    if 'raw_content_archive' not in columns:
+        with op.batch_alter_table('rss_articles') as batch_op:
+            batch_op.add_column(sa.Column('raw_content_archive', sa.LargeBinary()))
+
+
+def downgrade():
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.drop_column('raw_content_archive')
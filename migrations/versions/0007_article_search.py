@@ -0,0 +1,81 @@
+"""full-text search index over articles
+
+Revision ID: 0007_article_search
+Revises: 0006_raw_content_archive
+Create Date: 2026-10-17 00:00:06.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_article_search'
+down_revision = '0006_raw_content_archive'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with SCHEMA_SQL in scraper.py and app/search.py. The text is
+# capped so a huge page cannot exceed the tsvector size limit.
+SEARCH_VECTOR = """
+    setweight(to_tsvector('french', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('french', coalesce(summary, '')), 'B') ||
+    setweight(to_tsvector('french', left(coalesce(raw_content, ''), 100000)), 'C')
+"""
+
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS rss_articles_fts_insert AFTER INSERT ON rss_articles BEGIN
+        INSERT INTO rss_articles_fts (rowid, title, summary, raw_content)
+        VALUES (new.id, new.title, new.summary, new.raw_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS rss_articles_fts_delete AFTER DELETE ON rss_articles BEGIN
+        INSERT INTO rss_articles_fts (rss_articles_fts, rowid, title, summary, raw_content)
+        VALUES ('delete', old.id, old.title, old.summary, old.raw_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS rss_articles_fts_update AFTER UPDATE OF title, summary, raw_content ON rss_articles BEGIN
+        INSERT INTO rss_articles_fts (rss_articles_fts, rowid, title, summary, raw_content)
+        VALUES ('delete', old.id, old.title, old.summary, old.raw_content);
+        INSERT INTO rss_articles_fts (rowid, title, summary, raw_content)
+        VALUES (new.id, new.title, new.summary, new.raw_content);
+    END
+    """
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Adding a stored generated column rewrites the table once
+        op.execute(
+            f"ALTER TABLE rss_articles ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS idx_rss_articles_search ON rss_articles USING GIN (search_vector)")
+    elif dialect == 'sqlite':
+        # External-content FTS5 table: the index only, the text stays in rss_articles
+        tables = sa.inspect(op.get_bind()).get_table_names()
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS rss_articles_fts USING fts5("
+            "title, summary, raw_content, content='rss_articles', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        for trigger in FTS_TRIGGERS:
+            op.execute(trigger)
+        if 'rss_articles_fts' not in tables:
+            op.execute("INSERT INTO rss_articles_fts (rss_articles_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_rss_articles_search")
+        op.execute("ALTER TABLE rss_articles DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        for trigger in ('rss_articles_fts_insert', 'rss_articles_fts_delete', 'rss_articles_fts_update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS rss_articles_fts")
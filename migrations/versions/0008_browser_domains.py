@@ -0,0 +1,29 @@
+"""domains learned to need the browser tier
+
+Revision ID: 0008_browser_domains
+Revises: 0007_article_search
+Create Date: 2026-10-17 00:00:07.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_browser_domains'
+down_revision = '0007_article_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table('browser_domains'):
+        op.create_table(
+            'browser_domains',
+            sa.Column('domain', sa.Text(), primary_key=True),
+            sa.Column('learned_at', sa.DateTime(), server_default=sa.func.now()),
+        )
+
+
+def downgrade():
+    op.drop_table('browser_domains')
@@ -0,0 +1,29 @@
+"""article content hash for summary cache checks
+
+Revision ID: 0009_content_hash
+Revises: 0008_browser_domains
+Create Date: 2026-10-17 00:00:08.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009_content_hash'
+down_revision = '0008_browser_domains'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows are filled in by queue_summaries the next time they are read
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('rss_articles')}
+    if 'content_hash' not in columns:
+        with op.batch_alter_table('rss_articles') as batch_op:
+            batch_op.add_column(sa.Column('content_hash', sa.Text()))
+
+
+def downgrade():
+    with op.batch_alter_table('rss_articles') as batch_op:
+        batch_op.drop_column('content_hash')